@@ -7,14 +7,44 @@ Example usage:
 """
 
 import argparse
-import shutil
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+try:
+    from .unpack import LAZY_MANIFEST
+except ImportError:  # Run as a script from this directory
+    from unpack import LAZY_MANIFEST
+
+# Parts with these extensions are already compressed and are stored as-is
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".tif",
+    ".tiff",
+    ".wdp",
+    ".jxr",
+    ".mp3",
+    ".mp4",
+    ".m4a",
+    ".m4v",
+    ".mov",
+    ".wma",
+    ".wmv",
+    ".avi",
+    ".zip",
+    ".docx",
+    ".pptx",
+    ".xlsx",
+    ".odttf",
+}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -61,28 +91,44 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Collect parts up front so an output file inside input_dir is never packed
+    output_path = output_file.resolve()
+    files = [
+        f
+        for f in input_dir.rglob("*")
+        if f.is_file()
+        and f.resolve() != output_path
+        and f.relative_to(input_dir).as_posix() != LAZY_MANIFEST
+    ]
+    # [Content_Types].xml goes first, as Office readers expect
+    files.sort(
+        key=lambda f: f.relative_to(input_dir).as_posix() != "[Content_Types].xml"
+    )
+
+    # Create final Office file as zip archive, condensing XML parts in memory
+    # so the original directory is never modified
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in files:
+            arcname = f.relative_to(input_dir).as_posix()
+            # Checked by name since the root _rels/.rels has no suffix
+            if f.name.endswith((".xml", ".rels")):
+                zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                zf.writestr(
+                    zinfo,
+                    condense_xml_bytes(f.read_bytes()),
+                    compress_type=zipfile.ZIP_DEFLATED,
+                )
+            elif f.suffix.lower() in STORED_EXTENSIONS:
+                zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(f, arcname)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -131,28 +177,65 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    """Strip unnecessary whitespace and remove comments from a file in place."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes()))
+
+
+def condense_xml_bytes(xml_content):
+    """Strip unnecessary whitespace and remove comments from serialized XML.
+
+    Whitespace-only text and comments are removed from every element except
+    text elements (w:t, a:t, ...), whose content is significant. Entities are
+    never expanded and DTDs and network resources are never loaded.
+
+    Args:
+        xml_content: XML document as bytes
+
+    Returns:
+        bytes: The condensed document, UTF-8 encoded with an XML declaration
+    """
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False, strip_cdata=False
+    )
+    root = lxml.etree.fromstring(xml_content, parser)
 
     # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
+    for element in list(root.iter(lxml.etree.Element)):
         # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+        if lxml.etree.QName(element).localname == "t":
             continue
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+        # Remove whitespace-only text (before the first child and after each child)
+        if element.text is not None and element.text.strip() == "":
+            element.text = None
+        for child in element:
+            if child.tail is not None and child.tail.strip() == "":
+                child.tail = None
+
+        # Remove comment nodes, keeping any text that follows them
+        for child in list(element):
+            if child.tag is lxml.etree.Comment:
+                _remove_keeping_tail(child)
+
+    return lxml.etree.tostring(
+        root.getroottree(),
+        xml_declaration=True,
+        encoding="UTF-8",
+        standalone=root.getroottree().docinfo.standalone,
+    )
+
+
+def _remove_keeping_tail(node):
+    """Remove a node from its parent, moving its tail text to the previous node."""
+    parent = node.getparent()
+    if node.tail:
+        previous = node.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + node.tail
+        else:
+            parent.text = (parent.text or "") + node.tail
+    parent.remove(node)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,353 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--jobs N] [--lazy]
+    python unpack.py --format <xml_file> [<xml_file> ...]
+
+With --lazy, XML parts are extracted as-is and listed in a manifest
+(LAZY_MANIFEST) in the output directory; Document pretty-prints a listed part
+in its working copy when the part is first opened. Use --format to
+pretty-print specific parts in the unpacked directory before reading them.
+"""
+
+import argparse
+import os
 import random
-import sys
-import defusedxml.minidom
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+import lxml.etree
+
+# Every pretty-printed part starts with this declaration
+PRETTY_XML_DECLARATION = '<?xml version="1.0" encoding="ascii"?>\n'
+
+# Written by `unpack --lazy` into the output directory: relative paths of the
+# parts not pretty-printed yet, one per line. It is not a package part, so
+# pack.py and the validators skip it.
+LAZY_MANIFEST = ".unformatted_parts"
+
+# Namespace bound to the reserved "xml" prefix
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="<office_file> <output_dir>, or XML files to format with --format",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for pretty-printing (default: 1)",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Extract only; pretty-print parts when they are first opened",
+    )
+    parser.add_argument(
+        "--format",
+        action="store_true",
+        help="Pretty-print the given XML files in place (if left unformatted by --lazy)",
+    )
+    args = parser.parse_args()
+
+    if args.format:
+        pretty_print_parts(args.paths, jobs=args.jobs)
+        return
+
+    if len(args.paths) != 2:
+        parser.error("expected <office_file> <output_dir>")
+    input_file, output_dir = args.paths
+    unpack_document(input_file, output_dir, jobs=args.jobs, lazy=args.lazy)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, jobs=1, lazy=False):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if missing)
+        jobs: Number of worker processes used for pretty-printing
+        lazy: If True, leave XML parts as-is until they are opened for editing
+
+    Returns:
+        list: Paths of the extracted XML and .rels parts
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    zipfile.ZipFile(input_file).extractall(output_path)
+
+    xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
+    if lazy:
+        _write_manifest(
+            output_path, {f.relative_to(output_path).as_posix() for f in xml_files}
+        )
+    else:
+        (output_path / LAZY_MANIFEST).unlink(missing_ok=True)
+        pretty_print_parts(xml_files, jobs=jobs)
+    return xml_files
+
+
+def pretty_print_parts(xml_files, jobs=1):
+    """Pretty-print XML files in place, skipping those already formatted.
+
+    In a directory unpacked with --lazy, exactly the files its manifest lists
+    are formatted, and are then removed from the manifest. Elsewhere, files
+    that start like pretty_print_xml output are skipped.
+
+    Args:
+        xml_files: Paths of the XML files to format
+        jobs: Number of worker processes; parts are spread across a pool when > 1
+    """
+    tasks = []
+    formatted_parts = {}
+    for xml_file in map(Path, xml_files):
+        unpacked_dir = _find_lazy_dir(xml_file)
+        if unpacked_dir is None:
+            tasks.append((xml_file, False))
+            continue
+        part_name = xml_file.resolve().relative_to(unpacked_dir).as_posix()
+        if part_name in read_lazy_manifest(unpacked_dir):
+            tasks.append((xml_file, True))
+            formatted_parts.setdefault(unpacked_dir, set()).add(part_name)
+
+    if jobs > 1 and len(tasks) > 1:
+        jobs = min(jobs, len(tasks))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(tasks) // (jobs * 4))
+            list(executor.map(_format_task, tasks, chunksize=chunksize))
+    else:
+        for task in tasks:
+            _format_task(task)
+
+    for unpacked_dir, part_names in formatted_parts.items():
+        _write_manifest(unpacked_dir, read_lazy_manifest(unpacked_dir) - part_names)
+
+
+def read_lazy_manifest(unpacked_dir):
+    """Return the parts of an unpacked directory that --lazy left unformatted.
+
+    Returns:
+        set[str]: Relative POSIX paths; empty if the directory has no manifest
+    """
+    manifest = Path(unpacked_dir) / LAZY_MANIFEST
+    try:
+        return set(manifest.read_text(encoding="utf-8").splitlines())
+    except FileNotFoundError:
+        return set()
+
+
+def format_lazy_part(unpacked_dir, part_name):
+    """Pretty-print one part of a lazily unpacked directory on first use.
+
+    Does nothing unless the directory's manifest lists the part, so parts
+    that were formatted (or saved) since unpacking are never rewritten. The
+    part and the manifest are replaced rather than written in place, so
+    files hardlinked from another directory are left untouched.
+
+    Args:
+        unpacked_dir: Directory written by `unpack --lazy`
+        part_name: Relative POSIX path of the part (e.g. "word/document.xml")
+
+    Returns:
+        bool: True if the part was rewritten
+    """
+    unpacked_dir = Path(unpacked_dir)
+    parts = read_lazy_manifest(unpacked_dir)
+    if part_name not in parts:
+        return False
+    xml_file = unpacked_dir / part_name
+    _replace_bytes(xml_file, pretty_print_xml(xml_file.read_bytes()))
+    parts.discard(part_name)
+    _write_manifest(unpacked_dir, parts)
+    return True
+
+
+def is_pretty_printed(xml_file):
+    """Return True if the file starts like the output of pretty_print_xml.
+
+    Only a hint for files outside a lazily unpacked directory: files saved
+    by XMLEditor are formatted but lack the newline after the declaration.
+    """
+    with open(xml_file, "rb") as f:
+        header = f.read(len(PRETTY_XML_DECLARATION))
+    return header == PRETTY_XML_DECLARATION.encode("ascii")
+
+
+def ensure_pretty_printed(xml_file):
+    """Pretty-print an XML file in place unless it is already formatted.
+
+    Returns:
+        bool: True if the file was rewritten
+    """
+    xml_file = Path(xml_file)
+    if is_pretty_printed(xml_file):
+        return False
+    _replace_bytes(xml_file, pretty_print_xml(xml_file.read_bytes()))
+    return True
+
+
+def _format_task(task):
+    """Format one (xml_file, listed_in_manifest) task of pretty_print_parts."""
+    xml_file, listed = task
+    if listed:
+        _replace_bytes(xml_file, pretty_print_xml(xml_file.read_bytes()))
+    else:
+        ensure_pretty_printed(xml_file)
+
+
+def _find_lazy_dir(xml_file):
+    """Return the resolved lazily unpacked directory containing xml_file, if any."""
+    for directory in Path(xml_file).resolve().parents:
+        if (directory / LAZY_MANIFEST).is_file():
+            return directory
+    return None
+
+
+def _write_manifest(unpacked_dir, part_names):
+    """Replace the --lazy manifest.
+
+    An empty manifest is kept rather than removed, so that copying the
+    directory over an older copy of it also replaces that copy's manifest.
+    """
+    manifest = Path(unpacked_dir) / LAZY_MANIFEST
+    content = "".join(f"{name}\n" for name in sorted(part_names))
+    _replace_bytes(manifest, content.encode("utf-8"))
+
+
+def _replace_bytes(path, data):
+    """Write data to a temporary file and rename it over path."""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def pretty_print_xml(xml_content):
+    """Format an XML document with two-space indentation, ASCII encoded.
+
+    Produces the same layout as minidom's toprettyxml(indent="  ",
+    encoding="ascii"): one node per line, elements whose only child is text
+    kept on a single line, and non-ASCII characters written as character
+    references. Entities are never expanded, documents declaring entities are
+    rejected, and DTDs and network resources are never loaded.
+
+    Args:
+        xml_content: XML document as bytes
+
+    Returns:
+        bytes: The formatted document
+
+    Raises:
+        ValueError: If the document declares entities
+        lxml.etree.XMLSyntaxError: If the document is not well-formed
+    """
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False, strip_cdata=False
+    )
+    root = lxml.etree.fromstring(xml_content, parser)
+    dtd = root.getroottree().docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError("Entity declarations are not allowed in Office XML parts")
+
+    out = [PRETTY_XML_DECLARATION]
+    for node in reversed(list(root.itersiblings(preceding=True))):
+        _write_node(out, node, "", {})
+    _write_node(out, root, "", {})
+    for node in root.itersiblings():
+        _write_node(out, node, "", {})
+    return "".join(out).encode("ascii", "xmlcharrefreplace")
+
+
+def _escape(data):
+    """Escape text and attribute values the way minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _qualified_name(clark_name, prefix_for_uri):
+    """Turn a Clark-notation name back into prefix:local."""
+    if not clark_name.startswith("{"):
+        return clark_name
+    uri, local = clark_name[1:].split("}", 1)
+    prefix = prefix_for_uri.get(uri)
+    return f"{prefix}:{local}" if prefix else local
+
+
+def _write_node(out, node, indent, parent_nsmap):
+    """Append one node (and its subtree) to out, followed by a newline."""
+    if node.tag is lxml.etree.Comment:
+        out.append(f"{indent}<!--{node.text or ''}-->\n")
+        return
+    if node.tag is lxml.etree.PI:
+        out.append(f"{indent}<?{node.target} {node.text or ''}?>\n")
+        return
+
+    nsmap = node.nsmap
+    prefix_for_uri = {XML_NAMESPACE: "xml"}
+    for prefix, uri in nsmap.items():
+        if prefix is not None:
+            prefix_for_uri.setdefault(uri, prefix)
+
+    tag = lxml.etree.QName(node).localname
+    if node.prefix:
+        tag = f"{node.prefix}:{tag}"
+    out.append(f"{indent}<{tag}")
+
+    # Namespace declarations made on this element, then its attributes
+    for prefix, uri in nsmap.items():
+        if parent_nsmap.get(prefix) != uri:
+            name = f"xmlns:{prefix}" if prefix else "xmlns"
+            out.append(f' {name}="{_escape(uri)}"')
+    for name, value in node.attrib.items():
+        out.append(f' {_qualified_name(name, prefix_for_uri)}="{_escape(value)}"')
+
+    # Child nodes as minidom sees them: text, then each child and its tail
+    children = []
+    if node.text:
+        children.append(node.text)
+    for child in node:
+        children.append(child)
+        if child.tail:
+            children.append(child.tail)
+
+    if not children:
+        out.append("/>\n")
+    elif len(children) == 1 and isinstance(children[0], str):
+        out.append(f">{_escape(children[0])}</{tag}>\n")
+    else:
+        out.append(">\n")
+        child_indent = indent + "  "
+        for child in children:
+            if isinstance(child, str):
+                out.append(_escape(f"{child_indent}{child}\n"))
+            else:
+                _write_node(out, child, child_indent, nsmap)
+        out.append(f"{indent}</{tag}>\n")
+
+
+if __name__ == "__main__":
+    main()
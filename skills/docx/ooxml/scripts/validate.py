@@ -3,14 +3,22 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--json]
 """
 
 import argparse
+import contextlib
+import json
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaselinePackage,
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +38,18 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print per-check results and timings as JSON (messages go to stderr)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -52,15 +72,28 @@ def main():
             print(f"Error: Validation not supported for file type {file_extension}")
             sys.exit(1)
 
-    # Run validators
+    # Run validators (sharing one read-only view of the original file)
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    reports = []
+    baseline = BaselinePackage(original_file)
+    # Keep stdout clean for the JSON document
+    output = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(output):
+        for V in validators:
+            options = {"verbose": args.verbose, "baseline": baseline}
+            if issubclass(V, BaseSchemaValidator):
+                options["jobs"] = args.jobs
+            validator = V(unpacked_dir, original_file, **options)
+            if not validator.validate():
+                success = False
+            reports.append(validator.report())
+
+        if success:
+            print("All validations PASSED!")
 
-    if success:
-        print("All validations PASSED!")
+    if args.json:
+        json.dump({"passed": success, "validators": reports}, sys.stdout, indent=2)
+        print()
 
     sys.exit(0 if success else 1)
 
@@ -3,12 +3,16 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .baseline import BaselinePackage
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .results import CheckResult
 
 __all__ = [
     "BaseSchemaValidator",
+    "BaselinePackage",
+    "CheckResult",
     "DOCXSchemaValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
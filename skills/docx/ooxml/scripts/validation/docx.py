@@ -3,12 +3,105 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .results import check
+
+# Clark-notation tags used by the document rules
+W_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = f"{W_NAMESPACE}p"
+W_T = f"{W_NAMESPACE}t"
+W_DEL = f"{W_NAMESPACE}del"
+W_INS = f"{W_NAMESPACE}ins"
+W_DEL_TEXT = f"{W_NAMESPACE}delText"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def _text_preview(text):
+    """Return a repr of text truncated to 50 characters for error messages."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class DocumentRule:
+    """A check run during the single shared pass over each document.xml.
+
+    Subclasses list the Clark-notation tags they are interested in and
+    implement visit(). It is called when each such element ends, so its text
+    and attributes are complete. The context dict holds how many w:del and
+    w:ins elements enclose the element ("del" and "ins" depths).
+
+    Attributes:
+        relative_path: Path of the part relative to the unpacked directory
+        errors: Error messages found so far
+    """
+
+    tags = ()
+
+    def __init__(self, relative_path):
+        self.relative_path = relative_path
+        self.errors = []
+
+    def visit(self, elem, context):
+        """Inspect one element of interest."""
+        raise NotImplementedError("Subclasses must implement the visit method")
+
+
+class WhitespacePreservationRule(DocumentRule):
+    """w:t elements with leading or trailing whitespace need xml:space='preserve'."""
+
+    tags = (W_T,)
+
+    def visit(self, elem, context):
+        text = elem.text
+        # Check if text starts or ends with whitespace
+        if text and (re.match(r"^\s.*", text) or re.match(r".*\s$", text)):
+            # Check if xml:space="preserve" attribute exists
+            if elem.get(XML_SPACE) != "preserve":
+                self.errors.append(
+                    f"  {self.relative_path}: "
+                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {_text_preview(text)}"
+                )
+
+
+class DeletedTextRule(DocumentRule):
+    """w:t elements must not appear within w:del elements (XSD misses this)."""
+
+    tags = (W_T,)
+
+    def visit(self, elem, context):
+        if context["del"] and elem.text:
+            self.errors.append(
+                f"  {self.relative_path}: "
+                f"Line {elem.sourceline}: <w:t> found within <w:del>: {_text_preview(elem.text)}"
+            )
+
+
+class InsertedDelTextRule(DocumentRule):
+    """w:delText is only allowed in w:ins if nested within a w:del."""
+
+    tags = (W_DEL_TEXT,)
+
+    def visit(self, elem, context):
+        if context["ins"] and not context["del"]:
+            self.errors.append(
+                f"  {self.relative_path}: "
+                f"Line {elem.sourceline}: <w:delText> within <w:ins>: {_text_preview(elem.text or '')}"
+            )
+
+
+class ParagraphCountRule(DocumentRule):
+    """Counts w:p elements (used for the paragraph count summary)."""
+
+    tags = (W_P,)
+
+    def __init__(self, relative_path):
+        super().__init__(relative_path)
+        self.count = 0
+
+    def visit(self, elem, context):
+        self.count += 1
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -21,6 +114,14 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    # Rules applied to document.xml in one shared pass (see _check_document)
+    DOCUMENT_RULES = (
+        WhitespacePreservationRule,
+        DeletedTextRule,
+        InsertedDelTextRule,
+        ParagraphCountRule,
+    )
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
@@ -69,47 +170,82 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
-    def validate_whitespace_preservation(self):
-        """
-        Validate that w:t elements with whitespace have xml:space='preserve'.
+    def _check_document(self, xml_file):
+        """Run every rule in DOCUMENT_RULES over one document.xml in a single pass.
+
+        Walks the shared parsed tree once, dispatching each element to the
+        rules interested in its tag while tracking w:del/w:ins ancestry with
+        depth counters. Results are cached until the file changes.
+
+        Returns:
+            dict: "rules" -> {rule class: rule instance},
+                  "elements" -> number of elements walked,
+                  "error" -> exception raised while reading the file, or None
         """
+        return self._cached_for_file("document_rules", xml_file, self._run_rules)
+
+    def _run_rules(self, xml_file):
+        """Uncached implementation of _check_document."""
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        rules = {rule_cls: rule_cls(relative_path) for rule_cls in self.DOCUMENT_RULES}
+        dispatch = {}
+        for rule in rules.values():
+            for tag in rule.tags:
+                dispatch.setdefault(tag, []).append(rule)
+
+        context = {"del": 0, "ins": 0}
+        elements = 0
+        try:
+            root = self._parse_xml(xml_file).getroot()
+            for event, elem in lxml.etree.iterwalk(root, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    elements += 1
+                    if tag == W_DEL:
+                        context["del"] += 1
+                    elif tag == W_INS:
+                        context["ins"] += 1
+                    continue
+
+                for rule in dispatch.get(tag, ()):
+                    rule.visit(elem, context)
+
+                if tag == W_DEL:
+                    context["del"] -= 1
+                elif tag == W_INS:
+                    context["ins"] -= 1
+        except Exception as e:
+            return {"rules": rules, "elements": elements, "error": e}
+
+        return {"rules": rules, "elements": elements, "error": None}
+
+    def _get_rule_errors(self, rule_cls):
+        """Collect the errors one document rule found across all document.xml files."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_xml_files():
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
+            result = self._check_document(xml_file)
+            self._record(parts=1, elements=result["elements"])
+            if result["error"] is not None:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {result['error']}"
                 )
+            else:
+                errors.extend(result["rules"][rule_cls].errors)
+
+        self._record(errors)
+        return errors
+
+    @check
+    def validate_whitespace_preservation(self):
+        """
+        Validate that w:t elements with whitespace have xml:space='preserve'.
+        """
+        errors = self._get_rule_errors(WhitespacePreservationRule)
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -121,44 +257,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    @check
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
         For some reason, XSD validation does not catch this, so we do it manually.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = self._get_rule_errors(DeletedTextRule)
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -179,13 +284,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+            result = self._check_document(xml_file)
+            if result["error"] is not None:
+                print(
+                    f"Error counting paragraphs in unpacked document: {result['error']}"
+                )
+            else:
+                count = result["rules"][ParagraphCountRule].count
 
         return count
 
@@ -194,61 +299,25 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Parse document.xml straight from the original package
+            root = self.baseline.parse("word/document.xml").getroot()
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
 
         return count
 
+    @check
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
         w:delText is only allowed in w:ins if nested within a w:del.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = self._get_rule_errors(InsertedDelTextRule)
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -5,6 +5,7 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .results import check
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -74,6 +75,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @check
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
         import lxml.etree
@@ -84,12 +86,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
         )
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_xml_files():
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
+                elements = 0
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
+                    elements += 1
                     for attr, value in elem.attrib.items():
                         # Check if this is an ID attribute
                         attr_name = attr.split("}")[-1].lower()
@@ -103,11 +107,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                                         f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
                                     )
 
+                self._record(parts=1, elements=elements)
+
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
 
+        self._record(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
             for error in errors:
@@ -125,6 +132,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         # Check if it's 32 hex-like characters (could include invalid hex chars)
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
 
+    @check
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
         import lxml.etree
@@ -142,7 +150,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
@@ -155,7 +163,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -187,6 +195,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
 
+        self._record(errors, parts=len(slide_masters))
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
             for error in errors:
@@ -200,16 +209,15 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
+    @check
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
         slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -230,6 +238,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
 
+        self._record(errors, parts=len(slide_rels_files))
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
             for error in errors:
@@ -240,6 +249,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    @check
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
         import lxml.etree
@@ -258,7 +268,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -297,6 +307,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 for slide_name, rels_file in references:
                     errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
 
+        self._record(errors, parts=len(slide_rels_files))
         if errors:
             print(
                 f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
@@ -0,0 +1,793 @@
+"""
+In-process word diff producing the output of `git diff --word-diff=plain -U0`.
+
+The diff engine is a port of git's xdiff Myers implementation: equal prefixes
+and suffixes are trimmed, records without a match on the other side are
+discarded up front, the middle-snake split uses xdiff's cost heuristics, and
+the resulting changes are compacted (slid and aligned) the same way, with the
+indent heuristic for the line-level pass. Hunks, and therefore the word diff
+built from them, match what git prints for the same two texts.
+
+Example usage:
+    print(word_diff("the quick fox", "the slow fox", word_regex="."))
+"""
+
+import re
+from collections import Counter
+
+# xdiff tuning constants (xdiff/xdiffi.c, xdiff/xprepare.c)
+MAX_EQLIMIT = 1024
+SIMSCAN_WINDOW = 100
+KPDIS_RUN = 4
+MAX_COST_MIN = 256
+HEUR_MIN_COST = 256
+SNAKE_CNT = 20
+K_HEUR = 4
+
+# Indent heuristic weights (xdiff/xdiffi.c)
+MAX_INDENT = 200
+MAX_BLANKS = 20
+START_OF_FILE_PENALTY = 1
+END_OF_FILE_PENALTY = 21
+TOTAL_BLANK_WEIGHT = -30
+POST_BLANK_WEIGHT = 6
+RELATIVE_INDENT_PENALTY = -4
+RELATIVE_INDENT_WITH_BLANK_PENALTY = 10
+RELATIVE_OUTDENT_PENALTY = 24
+RELATIVE_OUTDENT_WITH_BLANK_PENALTY = 17
+RELATIVE_DEDENT_PENALTY = 23
+RELATIVE_DEDENT_WITH_BLANK_PENALTY = 17
+INDENT_WEIGHT = 60
+INDENT_HEURISTIC_MAX_SLIDING = 100
+
+# Work budget of one word_diff() call, counted in diagonal and snake steps.
+# Past it the remaining differences are reported as whole replacements, so
+# pathological inputs stay fast at the cost of a coarser (but still correct)
+# diff than git's.
+MAX_DIFF_STEPS = 1_000_000
+
+# Characters git's isspace() accepts
+WHITESPACE = " \t\n\r"
+
+# Word markers of --word-diff=plain
+DELETED_WORD = ("[-", "-]")
+INSERTED_WORD = ("{+", "+}")
+CONTEXT_WORD = ("", "")
+
+
+def word_diff(old_text, new_text, word_regex=None):
+    """
+    Diff two texts line by line, then word by word within each changed hunk.
+
+    Args:
+        old_text: Original text
+        new_text: Modified text
+        word_regex: Regular expression matching one word (e.g. "." for a
+            character-level diff); by default words are runs of non-whitespace
+
+    Returns:
+        str: What `git diff --no-index --word-diff=plain -U0` prints after the
+            file headers: an "@@ -a,b +c,d @@" line per hunk followed by the
+            hunk's words, with deletions as [-...-] and insertions as {+...+}
+    """
+    pattern = re.compile(word_regex, re.MULTILINE) if word_regex else None
+    budget = _Budget(MAX_DIFF_STEPS)
+    old_lines = _split_lines(old_text)
+    new_lines = _split_lines(new_text)
+
+    out = []
+    for start1, count1, start2, count2 in diff(
+        old_lines, new_lines, indent_heuristic=True, budget=budget
+    ):
+        out.append(_hunk_header(start1, count1, start2, count2))
+        # git reads a missing final newline as a line ending ("\ No newline")
+        minus = _terminate("".join(old_lines[start1 : start1 + count1]))
+        plus = _terminate("".join(new_lines[start2 : start2 + count2]))
+        out.append(_diff_words(minus, plus, pattern, budget))
+    return "".join(out)
+
+
+def diff(a, b, indent_heuristic=False, budget=None):
+    """
+    Compute the changed ranges between two sequences as git's xdiff does.
+
+    Args:
+        a: Original records (hashable, e.g. lines including their newline)
+        b: Modified records
+        indent_heuristic: Slide ambiguous changes with git's indent heuristic
+            (git diff uses it for lines, not for words)
+        budget: _Budget shared with other diffs (default: MAX_DIFF_STEPS for
+            this diff alone)
+
+    Returns:
+        list: (start_a, count_a, start_b, count_b) tuples, 0-based, in order
+    """
+    classes = {}
+    side_a = _Side(a, [classes.setdefault(rec, len(classes)) for rec in a])
+    side_b = _Side(b, [classes.setdefault(rec, len(classes)) for rec in b])
+
+    _trim_ends(side_a, side_b)
+    _cleanup_records(side_a, side_b)
+    _Myers(side_a, side_b, budget or _Budget(MAX_DIFF_STEPS)).run()
+    _change_compact(side_a, side_b, indent_heuristic)
+    _change_compact(side_b, side_a, indent_heuristic)
+    return _build_script(side_a, side_b)
+
+
+class _Budget:
+    """Steps of diff work left, shared by the diffs of one word_diff() call."""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def spent(self):
+        return self.steps < 0
+
+
+class _Side:
+    """One sequence of a diff and the state xdiff keeps for it.
+
+    changed holds one flag per record, shifted by one so that index 0 and
+    nrec + 1 are always-unchanged sentinels.
+    """
+
+    def __init__(self, records, classes):
+        self.records = records
+        self.ha = classes
+        self.nrec = len(records)
+        self.changed = [False] * (self.nrec + 2)
+        self.dstart = 0
+        self.dend = self.nrec - 1
+        # Records left for the Myers pass and their positions in records
+        self.reduced = []
+        self.rindex = []
+
+
+def _bogosqrt(n):
+    """xdiff's power-of-two approximation of the square root."""
+    i = 1
+    while n > 0:
+        n >>= 2
+        i <<= 1
+    return i
+
+
+def _trim_ends(side1, side2):
+    """Exclude the common prefix and suffix from the diff."""
+    ha1, ha2 = side1.ha, side2.ha
+    lim = min(side1.nrec, side2.nrec)
+    i = 0
+    while i < lim and ha1[i] == ha2[i]:
+        i += 1
+    side1.dstart = side2.dstart = i
+
+    lim -= i
+    j = 0
+    while j < lim and ha1[side1.nrec - 1 - j] == ha2[side2.nrec - 1 - j]:
+        j += 1
+    side1.dend = side1.nrec - j - 1
+    side2.dend = side2.nrec - j - 1
+
+
+def _cleanup_records(side1, side2):
+    """Discard records that cannot be matched before running Myers.
+
+    Records absent from the other side are changed outright; records that
+    occur very often on the other side are dropped when they sit in a run
+    of unmatched records (xdl_cleanup_records).
+    """
+    counts = (Counter(side2.ha), Counter(side1.ha))
+    for side, other_counts in zip((side1, side2), counts):
+        mlim = min(_bogosqrt(side.nrec), MAX_EQLIMIT)
+        dis = [0] * (side.nrec + 1)
+        for i in range(side.dstart, side.dend + 1):
+            matches = other_counts[side.ha[i]]
+            dis[i] = 0 if matches == 0 else 2 if matches >= mlim else 1
+
+        discarded = _clean_mmatch(dis, side.dstart, side.dend)
+        for i in range(side.dstart, side.dend + 1):
+            if dis[i] == 1 or (dis[i] == 2 and not discarded[i]):
+                side.rindex.append(i)
+                side.reduced.append(side.ha[i])
+            else:
+                side.changed[i + 1] = True
+
+
+def _clean_mmatch(dis, start, end):
+    """Decide which multi-match records lie in a run of unmatched ones.
+
+    Equivalent to calling xdl_clean_mmatch for every record, but the runs on
+    either side are measured with prefix counts instead of rescanning them.
+
+    Args:
+        dis: 0 (no match), 1 (kept) or 2 (multi-match) for each record
+        start: First record of the compared range
+        end: Last record of the compared range
+
+    Returns:
+        list: True for records in start..end that are discarded
+    """
+    size = len(dis)
+    discarded = [False] * size
+    # zeros[i] / twos[i]: number of 0 / 2 entries in dis[start:i]
+    zeros = [0] * (size + 1)
+    twos = [0] * (size + 1)
+    for i in range(start, end + 1):
+        zeros[i + 1] = zeros[i] + (dis[i] == 0)
+        twos[i + 1] = twos[i] + (dis[i] == 2)
+
+    # Nearest kept record (dis == 1) before and after each record
+    last_kept = [start - 1] * size
+    kept = start - 1
+    for i in range(start, end + 1):
+        last_kept[i] = kept
+        if dis[i] == 1:
+            kept = i
+    next_kept = [end + 1] * size
+    kept = end + 1
+    for i in range(end, start - 1, -1):
+        next_kept[i] = kept
+        if dis[i] == 1:
+            kept = i
+
+    for i in range(start, end + 1):
+        if dis[i] != 2:
+            continue
+        # The run before i stops at a kept record or the scan window
+        low = max(start, i - SIMSCAN_WINDOW, last_kept[i] + 1)
+        rdis0 = zeros[i] - zeros[low]
+        if rdis0 == 0:
+            continue
+        high = min(end, i + SIMSCAN_WINDOW, next_kept[i] - 1)
+        rdis1 = zeros[high + 1] - zeros[i + 1]
+        if rdis1 == 0:
+            continue
+        rpdis = 2 + (twos[i] - twos[low]) + (twos[high + 1] - twos[i + 1])
+        discarded[i] = rpdis * KPDIS_RUN < rpdis + rdis0 + rdis1
+    return discarded
+
+
+class _Myers:
+    """xdiff's divide-and-conquer Myers diff over the reduced records."""
+
+    def __init__(self, side1, side2, budget):
+        self.side1 = side1
+        self.side2 = side2
+        self.ha1 = side1.reduced
+        self.ha2 = side2.reduced
+        n1, n2 = len(self.ha1), len(self.ha2)
+        ndiags = n1 + n2 + 3
+        # Furthest-reaching paths by diagonal, offset so diagonal -n2 - 1 is 0
+        self.offset = n2 + 1
+        self.kvdf = [0] * ndiags
+        self.kvdb = [0] * ndiags
+        self.mxcost = max(_bogosqrt(ndiags), MAX_COST_MIN)
+        self.budget = budget
+
+    def run(self):
+        """Mark the changed records of both sides (xdl_recs_cmp)."""
+        ha1, ha2 = self.ha1, self.ha2
+        boxes = [(0, len(ha1), 0, len(ha2), False)]
+        while boxes:
+            off1, lim1, off2, lim2, need_min = boxes.pop()
+
+            # Shrink the box by walking through each diagonal snake
+            while off1 < lim1 and off2 < lim2 and ha1[off1] == ha2[off2]:
+                off1 += 1
+                off2 += 1
+            while off1 < lim1 and off2 < lim2 and ha1[lim1 - 1] == ha2[lim2 - 1]:
+                lim1 -= 1
+                lim2 -= 1
+
+            if off1 == lim1 or off2 == lim2 or self.budget.spent():
+                # One side is empty (or the budget is spent): all is changed
+                for i in range(off1, lim1):
+                    self.side1.changed[self.side1.rindex[i] + 1] = True
+                for i in range(off2, lim2):
+                    self.side2.changed[self.side2.rindex[i] + 1] = True
+                continue
+
+            i1, i2, min_lo, min_hi = self._split(off1, lim1, off2, lim2, need_min)
+            boxes.append((i1, lim1, i2, lim2, min_hi))
+            boxes.append((off1, i1, off2, i2, min_lo))
+
+    def _split(self, off1, lim1, off2, lim2, need_min):
+        """Find where to split the box (xdl_split).
+
+        Returns:
+            tuple: (i1, i2, min_lo, min_hi) - the split point and whether each
+                half still needs a minimal diff
+        """
+        ha1, ha2 = self.ha1, self.ha2
+        kvdf, kvdb, o = self.kvdf, self.kvdb, self.offset
+        budget = self.budget
+        dmin, dmax = off1 - lim2, lim1 - off2
+        fmid, bmid = off1 - off2, lim1 - lim2
+        odd = (fmid - bmid) & 1
+        fmin = fmax = fmid
+        bmin = bmax = bmid
+
+        kvdf[fmid + o] = off1
+        kvdb[bmid + o] = lim1
+
+        ec = 0
+        while True:
+            ec += 1
+            got_snake = False
+
+            # Extend the forward diagonal domain by one
+            if fmin > dmin:
+                fmin -= 1
+                kvdf[fmin - 1 + o] = -1
+            else:
+                fmin += 1
+            if fmax < dmax:
+                fmax += 1
+                kvdf[fmax + 1 + o] = -1
+            else:
+                fmax -= 1
+
+            for d in range(fmax, fmin - 1, -2):
+                if kvdf[d - 1 + o] >= kvdf[d + 1 + o]:
+                    i1 = kvdf[d - 1 + o] + 1
+                else:
+                    i1 = kvdf[d + 1 + o]
+                prev1 = i1
+                i2 = i1 - d
+                while i1 < lim1 and i2 < lim2 and ha1[i1] == ha2[i2]:
+                    i1 += 1
+                    i2 += 1
+                budget.steps -= 1 + i1 - prev1
+                if i1 - prev1 > SNAKE_CNT:
+                    got_snake = True
+                kvdf[d + o] = i1
+                if odd and bmin <= d <= bmax and kvdb[d + o] <= i1:
+                    return i1, i2, True, True
+
+            # Extend the backward diagonal domain by one
+            if bmin > dmin:
+                bmin -= 1
+                kvdb[bmin - 1 + o] = _LINE_MAX
+            else:
+                bmin += 1
+            if bmax < dmax:
+                bmax += 1
+                kvdb[bmax + 1 + o] = _LINE_MAX
+            else:
+                bmax -= 1
+
+            for d in range(bmax, bmin - 1, -2):
+                if kvdb[d - 1 + o] < kvdb[d + 1 + o]:
+                    i1 = kvdb[d - 1 + o]
+                else:
+                    i1 = kvdb[d + 1 + o] - 1
+                prev1 = i1
+                i2 = i1 - d
+                while i1 > off1 and i2 > off2 and ha1[i1 - 1] == ha2[i2 - 1]:
+                    i1 -= 1
+                    i2 -= 1
+                budget.steps -= 1 + prev1 - i1
+                if prev1 - i1 > SNAKE_CNT:
+                    got_snake = True
+                kvdb[d + o] = i1
+                if not odd and fmin <= d <= fmax and i1 <= kvdf[d + o]:
+                    return i1, i2, True, True
+
+            if need_min:
+                continue
+
+            # Past the heuristic trigger, accept a diagonal that reached an
+            # "interesting" point: far from the corner and ending a long snake
+            if got_snake and ec > HEUR_MIN_COST:
+                best = 0
+                for d in range(fmax, fmin - 1, -2):
+                    dd = d - fmid if d > fmid else fmid - d
+                    i1 = kvdf[d + o]
+                    i2 = i1 - d
+                    v = (i1 - off1) + (i2 - off2) - dd
+                    if (
+                        v > K_HEUR * ec
+                        and v > best
+                        and off1 + SNAKE_CNT <= i1 < lim1
+                        and off2 + SNAKE_CNT <= i2 < lim2
+                    ):
+                        k = 1
+                        while ha1[i1 - k] == ha2[i2 - k]:
+                            if k == SNAKE_CNT:
+                                best = v
+                                split = (i1, i2)
+                                break
+                            k += 1
+                if best > 0:
+                    return split[0], split[1], True, False
+
+                best = 0
+                for d in range(bmax, bmin - 1, -2):
+                    dd = d - bmid if d > bmid else bmid - d
+                    i1 = kvdb[d + o]
+                    i2 = i1 - d
+                    v = (lim1 - i1) + (lim2 - i2) - dd
+                    if (
+                        v > K_HEUR * ec
+                        and v > best
+                        and off1 < i1 <= lim1 - SNAKE_CNT
+                        and off2 < i2 <= lim2 - SNAKE_CNT
+                    ):
+                        k = 0
+                        while ha1[i1 + k] == ha2[i2 + k]:
+                            if k == SNAKE_CNT - 1:
+                                best = v
+                                split = (i1, i2)
+                                break
+                            k += 1
+                if best > 0:
+                    return split[0], split[1], False, True
+
+            # Enough is enough: take the furthest-reaching path so far
+            if ec >= self.mxcost or self.budget.spent():
+                fbest = fbest1 = -1
+                for d in range(fmax, fmin - 1, -2):
+                    i1 = min(kvdf[d + o], lim1)
+                    i2 = i1 - d
+                    if lim2 < i2:
+                        i1, i2 = lim2 + d, lim2
+                    if fbest < i1 + i2:
+                        fbest, fbest1 = i1 + i2, i1
+
+                bbest = bbest1 = _LINE_MAX
+                for d in range(bmax, bmin - 1, -2):
+                    i1 = max(off1, kvdb[d + o])
+                    i2 = i1 - d
+                    if i2 < off2:
+                        i1, i2 = off2 + d, off2
+                    if i1 + i2 < bbest:
+                        bbest, bbest1 = i1 + i2, i1
+
+                if (lim1 + lim2) - bbest < fbest - (off1 + off2):
+                    return fbest1, fbest - fbest1, True, False
+                return bbest1, bbest - bbest1, False, True
+
+
+# Stands in for xdiff's XDL_LINE_MAX in the backward diagonals
+_LINE_MAX = float("inf")
+
+
+def _change_compact(side, other, indent_heuristic):
+    """Slide groups of changes to their canonical place (xdl_change_compact).
+
+    Each group is moved as far down as it can go, then back up to line up
+    with a change on the other side if possible, or else to the position the
+    indent heuristic prefers.
+    """
+    g = _Group(side)
+    go = _Group(other)
+
+    while True:
+        if g.end != g.start:
+            while True:
+                groupsize = g.end - g.start
+                end_matching_other = -1
+
+                # Shift the group backward as much as possible
+                while g.slide_up():
+                    go.previous()
+                earliest_end = g.end
+                if go.end > go.start:
+                    end_matching_other = g.end
+
+                # Now shift the group forward as far as possible
+                while g.slide_down():
+                    go.next()
+                    if go.end > go.start:
+                        end_matching_other = g.end
+
+                if groupsize == g.end - g.start:
+                    break
+
+            if g.end == earliest_end:
+                pass  # no shifting was possible
+            elif end_matching_other != -1:
+                # Line up with the last change on the other side it can reach
+                while go.end == go.start:
+                    g.slide_up()
+                    go.previous()
+            elif indent_heuristic:
+                shift = max(
+                    earliest_end,
+                    g.end - groupsize - 1,
+                    g.end - INDENT_HEURISTIC_MAX_SLIDING,
+                )
+                best_shift = -1
+                best_score = None
+                while shift <= g.end:
+                    score = [0, 0]
+                    _score_add_split(_measure_split(side, shift), score)
+                    _score_add_split(_measure_split(side, shift - groupsize), score)
+                    if best_shift == -1 or _score_cmp(score, best_score) <= 0:
+                        best_score = score
+                        best_shift = shift
+                    shift += 1
+                while g.end > best_shift:
+                    g.slide_up()
+                    go.previous()
+
+        if not g.next():
+            break
+        go.next()
+
+
+class _Group:
+    """A run of changed records in one side, possibly empty (struct xdlgroup)."""
+
+    def __init__(self, side):
+        self.side = side
+        self.changed = side.changed
+        self.start = self.end = 0
+        while self.changed[self.end + 1]:
+            self.end += 1
+
+    def next(self):
+        """Move to the next group; return False at the end of the sequence."""
+        if self.end == self.side.nrec:
+            return False
+        self.start = self.end + 1
+        self.end = self.start
+        while self.changed[self.end + 1]:
+            self.end += 1
+        return True
+
+    def previous(self):
+        """Move to the previous group; return False at the start."""
+        if self.start == 0:
+            return False
+        self.end = self.start - 1
+        self.start = self.end
+        while self.changed[self.start]:
+            self.start -= 1
+        return True
+
+    def slide_down(self):
+        """Shift the group down by one record if it can; merge what it meets."""
+        ha = self.side.ha
+        if self.end < self.side.nrec and ha[self.start] == ha[self.end]:
+            self.changed[self.start + 1] = False
+            self.changed[self.end + 1] = True
+            self.start += 1
+            self.end += 1
+            while self.changed[self.end + 1]:
+                self.end += 1
+            return True
+        return False
+
+    def slide_up(self):
+        """Shift the group up by one record if it can; merge what it meets."""
+        ha = self.side.ha
+        if self.start > 0 and ha[self.start - 1] == ha[self.end - 1]:
+            self.start -= 1
+            self.end -= 1
+            self.changed[self.start + 1] = True
+            self.changed[self.end + 1] = False
+            while self.changed[self.start]:
+                self.start -= 1
+            return True
+        return False
+
+
+def _get_indent(record):
+    """Indent width of a line, or -1 if it is blank."""
+    indent = 0
+    for char in record:
+        if char not in WHITESPACE:
+            return indent
+        if char == " ":
+            indent += 1
+        elif char == "\t":
+            indent += 8 - indent % 8
+        if indent >= MAX_INDENT:
+            return MAX_INDENT
+    return -1
+
+
+def _measure_split(side, split):
+    """Describe the lines around a split before record split (measure_split).
+
+    Returns:
+        tuple: (end_of_file, indent, pre_blank, pre_indent, post_blank, post_indent)
+    """
+    records = side.records
+    if split >= side.nrec:
+        end_of_file, indent = True, -1
+    else:
+        end_of_file, indent = False, _get_indent(records[split])
+
+    pre_blank, pre_indent = 0, -1
+    for i in range(split - 1, -1, -1):
+        pre_indent = _get_indent(records[i])
+        if pre_indent != -1:
+            break
+        pre_blank += 1
+        if pre_blank == MAX_BLANKS:
+            pre_indent = 0
+            break
+
+    post_blank, post_indent = 0, -1
+    for i in range(split + 1, side.nrec):
+        post_indent = _get_indent(records[i])
+        if post_indent != -1:
+            break
+        post_blank += 1
+        if post_blank == MAX_BLANKS:
+            post_indent = 0
+            break
+
+    return end_of_file, indent, pre_blank, pre_indent, post_blank, post_indent
+
+
+def _score_add_split(measurement, score):
+    """Add the badness of one split to score, a [effective_indent, penalty] pair."""
+    end_of_file, indent, pre_blank, pre_indent, post_blank, post_indent = measurement
+
+    if pre_indent == -1 and pre_blank == 0:
+        score[1] += START_OF_FILE_PENALTY
+    if end_of_file:
+        score[1] += END_OF_FILE_PENALTY
+
+    # Blank lines following the split, including the line right after it
+    post_blank = 1 + post_blank if indent == -1 else 0
+    total_blank = pre_blank + post_blank
+    score[1] += TOTAL_BLANK_WEIGHT * total_blank
+    score[1] += POST_BLANK_WEIGHT * post_blank
+
+    if indent == -1:
+        indent = post_indent
+    any_blanks = total_blank != 0
+
+    # The effective indent is -1 at the end of the file
+    score[0] += indent
+
+    if indent == -1 or pre_indent == -1:
+        pass
+    elif indent > pre_indent:
+        score[1] += (
+            RELATIVE_INDENT_WITH_BLANK_PENALTY
+            if any_blanks
+            else RELATIVE_INDENT_PENALTY
+        )
+    elif indent == pre_indent:
+        pass
+    elif post_indent != -1 and post_indent > indent:
+        score[1] += (
+            RELATIVE_OUTDENT_WITH_BLANK_PENALTY
+            if any_blanks
+            else RELATIVE_OUTDENT_PENALTY
+        )
+    else:
+        score[1] += (
+            RELATIVE_DEDENT_WITH_BLANK_PENALTY
+            if any_blanks
+            else RELATIVE_DEDENT_PENALTY
+        )
+
+
+def _score_cmp(score1, score2):
+    """Compare two split scores; negative if score1 is better."""
+    cmp_indents = (score1[0] > score2[0]) - (score1[0] < score2[0])
+    return INDENT_WEIGHT * cmp_indents + (score1[1] - score2[1])
+
+
+def _build_script(side1, side2):
+    """Collect the changed ranges of both sides into hunks."""
+    changed1, changed2 = side1.changed, side2.changed
+    hunks = []
+    i1 = i2 = 0
+    while i1 < side1.nrec or i2 < side2.nrec:
+        if changed1[i1 + 1] or changed2[i2 + 1]:
+            start1, start2 = i1, i2
+            while changed1[i1 + 1]:
+                i1 += 1
+            while changed2[i2 + 1]:
+                i2 += 1
+            hunks.append((start1, i1 - start1, start2, i2 - start2))
+        else:
+            i1 += 1
+            i2 += 1
+    return hunks
+
+
+def _split_lines(text):
+    """Split text into lines that keep their "\\n" (only "\\n" ends a line)."""
+    lines = text.split("\n")
+    records = [line + "\n" for line in lines[:-1]]
+    if lines[-1]:
+        records.append(lines[-1])
+    return records
+
+
+def _terminate(text):
+    """Return text ending with a newline, unless it is empty."""
+    return text + "\n" if text and not text.endswith("\n") else text
+
+
+def _hunk_header(start1, count1, start2, count2):
+    """Format a hunk header; an empty range names the line before it."""
+
+    def hunk_range(start, count):
+        first = start + 1 if count else start
+        return str(first) if count == 1 else f"{first},{count}"
+
+    return f"@@ -{hunk_range(start1, count1)} +{hunk_range(start2, count2)} @@\n"
+
+
+def _find_words(text, pattern):
+    """Return the (begin, end) offsets of the words of text.
+
+    Without a pattern words are runs of non-whitespace. A pattern match never
+    spans a newline, and an empty match ends the scan, as in git.
+    """
+    if pattern is None:
+        return [match.span() for match in re.finditer(r"[^ \t\n\r]+", text)]
+
+    words = []
+    pos = 0
+    while pos < len(text):
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        begin, end = match.span()
+        newline = text.find("\n", begin, end)
+        if newline != -1:
+            end = newline
+        if begin == end:
+            break
+        words.append((begin, end))
+        pos = end
+    return words
+
+
+def _diff_words(minus, plus, pattern, budget):
+    """Word-diff the removed and added lines of one hunk (diff_words_show)."""
+    if not plus:
+        return _mark(minus, DELETED_WORD)
+
+    minus_words = _find_words(minus, pattern)
+    plus_words = _find_words(plus, pattern)
+    hunks = diff(
+        [minus[begin:end] for begin, end in minus_words],
+        [plus[begin:end] for begin, end in plus_words],
+        budget=budget,
+    )
+
+    def span(words, start, count):
+        if count:
+            return words[start][0], words[start + count - 1][1]
+        # An empty range sits right after the previous word
+        position = words[start - 1][1] if start else 0
+        return position, position
+
+    out = []
+    current = 0
+    for start1, count1, start2, count2 in hunks:
+        minus_begin, minus_end = span(minus_words, start1, count1)
+        plus_begin, plus_end = span(plus_words, start2, count2)
+        if current != plus_begin:
+            out.append(_mark(plus[current:plus_begin], CONTEXT_WORD))
+        if minus_begin != minus_end:
+            out.append(_mark(minus[minus_begin:minus_end], DELETED_WORD))
+        if plus_begin != plus_end:
+            out.append(_mark(plus[plus_begin:plus_end], INSERTED_WORD))
+        current = plus_end
+    if current != len(plus):
+        out.append(_mark(plus[current:], CONTEXT_WORD))
+    return "".join(out)
+
+
+def _mark(text, markers):
+    """Wrap each line segment of text in the given prefix and suffix."""
+    prefix, suffix = markers
+    return "\n".join(
+        f"{prefix}{segment}{suffix}" if segment else "" for segment in text.split("\n")
+    )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
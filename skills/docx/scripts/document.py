@@ -22,27 +22,67 @@ Usage:
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply a whole set of edits in one pass
+    doc["word/document.xml"].apply_edits([("suggest_deletion", node), ...])
+
     # Save
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+import lxml.etree
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.unpack import format_lazy_part
+from ooxml.scripts.validation.baseline import BaselinePackage
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import XML_NAMESPACE, LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Namespaces of the attributes the Word editors add, by conventional prefix
+NAMESPACES = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+    "w16du": "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
+    "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+}
+XML_SPACE = f"{{{XML_NAMESPACE}}}space"
+
+# Operations accepted by DocxXMLEditor.apply_edits()
+FRAGMENT_OPERATIONS = ("replace_node", "insert_after", "insert_before", "append_to")
+TRACKED_CHANGE_OPERATIONS = ("suggest_deletion", "revert_insertion", "revert_deletion")
+
+
+@dataclass
+class EditSummary:
+    """What a DocxXMLEditor.apply_edits() call changed.
+
+    Attributes:
+        operations: Number of edits applied, per operation name
+        results: Return value of each edit, as the single-edit method returns it
+        inserted: Number of top-level elements inserted from XML fragments
+        removed: Number of elements removed by replace_node edits
+        change_ids: w:id values assigned to new w:ins/w:del elements
+    """
+
+    operations: dict = field(default_factory=dict)
+    results: list = field(default_factory=list)
+    inserted: int = 0
+    removed: int = 0
+    change_ids: list = field(default_factory=list)
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -56,6 +96,12 @@ class DocxXMLEditor(XMLEditor):
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
+    ID_COUNTERS = {
+        **XMLEditor.ID_COUNTERS,
+        "change": (("w:ins", "w:del"), "w:id", "", 0),
+        "comment": (("w:comment",), "w:id", "", 0),
+    }
+
     def __init__(
         self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
     ):
@@ -72,24 +118,18 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # Nodes awaiting attribute injection while apply_edits() runs
+        self._pending_injection = None
+
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Reserve and return the next available tracked change ID."""
+        return self._allocate_id("change")
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16du"):  # type: ignore
+            self.dirty = True
             root.setAttribute(  # type: ignore
                 "xmlns:w16du",
                 "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
@@ -97,8 +137,9 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
+            self.dirty = True
             root.setAttribute(  # type: ignore
                 "xmlns:w16cex",
                 "http://schemas.microsoft.com/office/word/2018/wordml/cex",
@@ -106,8 +147,9 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w14"):  # type: ignore
+            self.dirty = True
             root.setAttribute(  # type: ignore
                 "xmlns:w14",
                 "http://schemas.microsoft.com/office/word/2010/wordml",
@@ -124,12 +166,23 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        The nodes and their descendants are visited in one traversal that
+        carries whether the current element is inside a w:del. During
+        apply_edits() the nodes are queued and processed once at the end.
+
         Args:
             nodes: List of DOM nodes to process
+
+        Returns:
+            list: The w:id values assigned to w:ins/w:del elements
         """
-        from datetime import datetime, timezone
+        self.dirty = True
+        if self._pending_injection is not None:
+            self._pending_injection.extend(nodes)
+            return []
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        change_ids = []
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
@@ -155,9 +208,9 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, in_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if in_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -167,7 +220,9 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                change_id = str(self._get_next_change_id())
+                elem.setAttribute("w:id", change_id)
+                change_ids.append(change_id)
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,38 +259,38 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            # Depth-first, in document order; each entry carries its w:del context
+            stack = [(node, is_inside_deletion(node))]
+            while stack:
+                elem, in_deletion = stack.pop()
+                tag = elem.tagName
+                if tag == "w:r":
+                    add_rsid_to_r(elem, in_deletion)
+                elif tag in handlers:
+                    handlers[tag](elem)
+                in_deletion = in_deletion or tag == "w:del"
+                stack.extend(
+                    (child, in_deletion)
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
+
+        # Refresh lookup indexes for the attributes added above
+        self._index_nodes(nodes)
+        return change_ids
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -261,6 +316,76 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def apply_edits(self, edits):
+        """Apply many edits at once, injecting attributes in a single pass.
+
+        Each edit is a tuple naming one of the editing methods, the element it
+        applies to and, for the fragment operations, the XML to insert:
+
+            ("replace_node" | "insert_after" | "insert_before" | "append_to", elem, xml)
+            ("suggest_deletion" | "revert_insertion" | "revert_deletion", elem)
+
+        Edits run in order with the same effect as calling the methods one by
+        one, but all XML fragments are parsed in one wrapper document and the
+        RSID/author/date/w:id injection runs once over everything inserted.
+
+        Args:
+            edits: Iterable of edit tuples
+
+        Returns:
+            EditSummary: What was changed, including each edit's return value
+
+        Raises:
+            ValueError: If an edit names an unknown operation or has the wrong
+                number of arguments (checked before anything is changed)
+
+        Example:
+            editor = doc["word/document.xml"]
+            summary = editor.apply_edits([
+                ("suggest_deletion", old_run),
+                ("insert_after", para, "<w:p><w:ins><w:r><w:t>New</w:t></w:r></w:ins></w:p>"),
+            ])
+            print(summary.change_ids)
+        """
+        edits = [tuple(edit) for edit in edits]
+        for edit in edits:
+            operation = edit[0] if edit else None
+            if operation in FRAGMENT_OPERATIONS:
+                expected = 3
+            elif operation in TRACKED_CHANGE_OPERATIONS:
+                expected = 2
+            else:
+                raise ValueError(f"Unknown edit operation: {operation!r}")
+            if len(edit) != expected:
+                raise ValueError(
+                    f"{operation} edits take {expected - 1} argument(s), got {len(edit) - 1}"
+                )
+
+        fragments = iter(
+            self._parse_fragments(
+                [edit[2] for edit in edits if edit[0] in FRAGMENT_OPERATIONS]
+            )
+        )
+        summary = EditSummary()
+        self._pending_injection = []
+        try:
+            for operation, elem, *_ in edits:
+                if operation in FRAGMENT_OPERATIONS:
+                    result = next(fragments)
+                    self._place_nodes(operation, elem, result)
+                    self._inject_attributes_to_nodes(result)
+                    summary.inserted += sum(map(self._is_element, result))
+                    if operation == "replace_node":
+                        summary.removed += 1
+                else:
+                    result = getattr(self, operation)(elem)
+                summary.results.append(result)
+                summary.operations[operation] = summary.operations.get(operation, 0) + 1
+        finally:
+            pending, self._pending_injection = self._pending_injection, None
+            summary.change_ids = self._inject_attributes_to_nodes(pending)
+        return summary
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -299,6 +424,8 @@ class DocxXMLEditor(XMLEditor):
                 f"The provided element <{elem.tagName}> contains no insertions. "
             )
 
+        self._unindex_node(elem)
+
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
             runs = list(ins_elem.getElementsByTagName("w:r"))
@@ -306,7 +433,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
 
             # Process each run
             for run in runs:
@@ -318,7 +445,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
+                    del_text = self._dom.createElement("w:delText")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while t_elem.firstChild:
                         del_text.appendChild(t_elem.firstChild)
@@ -337,6 +464,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        self._index_nodes([elem])
         return [elem]
 
     def revert_deletion(self, elem):
@@ -391,7 +519,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._dom.createElement("w:ins")
 
             for run in runs:
                 # Clone the run
@@ -399,7 +527,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
+                    t_elem = self._dom.createElement("w:t")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while del_text.firstChild:
                         t_elem.appendChild(del_text.firstChild)
@@ -418,7 +546,9 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            nodes = [ins_elem]
+            self._place_nodes("insert_after", del_elem, nodes)
+            self._inject_attributes_to_nodes(nodes)
 
             # If processing a single w:del, track the created insertion
             if is_single_del and nodes:
@@ -500,9 +630,11 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
 
+            self._unindex_node(elem)
+
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -520,13 +652,13 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
 
-            # Inject attributes to the deletion wrapper
+            # Inject attributes to the deletion wrapper (also re-indexes the run)
             self._inject_attributes_to_nodes([del_wrapper])
 
             return del_wrapper
@@ -536,6 +668,8 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
 
+            self._unindex_node(elem)
+
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
             is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
@@ -546,20 +680,20 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._dom.createElement("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._dom.createElement("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -578,7 +712,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
@@ -587,12 +721,305 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self._index_nodes([elem])
             return elem
 
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on the lxml backend (see LxmlXMLEditor).
+
+    Injects the same attributes and offers the same tracked change operations
+    as DocxXMLEditor, working on lxml elements. Use it for very large parts,
+    or let Document pick it with Document(..., backend="lxml").
+
+    Attributes:
+        dom (lxml.etree._ElementTree): The parsed tree for direct manipulation
+    """
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes, as DocxXMLEditor does.
+
+        Args:
+            nodes: List of lxml elements to process
+
+        Returns:
+            list: The w:id values assigned to w:ins/w:del elements
+        """
+        self.dirty = True
+        if self._pending_injection is not None:
+            self._pending_injection.extend(nodes)
+            return []
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        change_ids = []
+
+        def set_default(elem, prefix, name, value):
+            # Set prefix:name unless present; value may be a callable
+            attr_name = f"{{{NAMESPACES[prefix]}}}{name}"
+            if attr_name in elem.attrib:
+                return False
+            if prefix != "w":
+                self._ensure_namespace(prefix, NAMESPACES[prefix])
+            elem.set(attr_name, value() if callable(value) else value)
+            return True
+
+        def add_rsid_to_p(elem):
+            set_default(elem, "w", "rsidR", self.rsid)
+            set_default(elem, "w", "rsidRDefault", self.rsid)
+            set_default(elem, "w", "rsidP", self.rsid)
+            set_default(elem, "w14", "paraId", _generate_hex_id)
+            set_default(elem, "w14", "textId", _generate_hex_id)
+
+        def add_tracked_change_attrs(elem):
+            if set_default(elem, "w", "id", lambda: str(self._get_next_change_id())):
+                change_ids.append(elem.get(_w("id")))
+            set_default(elem, "w", "author", self.author)
+            set_default(elem, "w", "date", timestamp)
+            set_default(elem, "w16du", "dateUtc", timestamp)
+
+        def add_comment_attrs(elem):
+            set_default(elem, "w", "author", self.author)
+            set_default(elem, "w", "date", timestamp)
+            set_default(elem, "w", "initials", self.initials)
+
+        def add_comment_extensible_date(elem):
+            set_default(elem, "w16cex", "dateUtc", timestamp)
+
+        def add_xml_space_to_t(elem):
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if XML_SPACE not in elem.attrib:
+                    elem.set(XML_SPACE, "preserve")
+
+        handlers = {
+            _w("p"): add_rsid_to_p,
+            _w("t"): add_xml_space_to_t,
+            _w("ins"): add_tracked_change_attrs,
+            _w("del"): add_tracked_change_attrs,
+            _w("comment"): add_comment_attrs,
+            f"{{{NAMESPACES['w16cex']}}}commentExtensible": add_comment_extensible_date,
+        }
+        run_tag = _w("r")
+        del_tag = _w("del")
+
+        for node in nodes:
+            if not isinstance(node.tag, str):
+                continue
+
+            in_deletion = any(True for _ in node.iterancestors(del_tag))
+            stack = [(node, in_deletion)]
+            while stack:
+                elem, in_deletion = stack.pop()
+                tag = elem.tag
+                if tag == run_tag:
+                    set_default(
+                        elem, "w", "rsidDel" if in_deletion else "rsidR", self.rsid
+                    )
+                elif tag in handlers:
+                    handlers[tag](elem)
+                in_deletion = in_deletion or tag == del_tag
+                stack.extend(
+                    (child, in_deletion)
+                    for child in reversed(elem)
+                    if isinstance(child.tag, str)
+                )
+
+        return change_ids
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+        """
+        if elem.tag == _w("ins"):
+            ins_elements = [elem]
+        else:
+            ins_elements = list(elem.iter(_w("ins")))
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self._get_tag(elem)}> contains no insertions. "
+            )
+
+        for ins_elem in ins_elements:
+            runs = list(ins_elem.iter(_w("r")))
+            if not runs:
+                continue
+
+            for run in runs:
+                _swap_attribute(run, _w("rsidR"), _w("rsidDel"), self.rsid)
+                for t_elem in run.iter(_w("t")):
+                    t_elem.tag = _w("delText")
+
+            # Move all content of the insertion into a deletion wrapper
+            del_wrapper = ins_elem.makeelement(_w("del"))
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(ins_elem)
+            ins_elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+        """
+        is_single_del = elem.tag == _w("del")
+        del_elements = [elem] if is_single_del else list(elem.iter(_w("del")))
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self._get_tag(elem)}> contains no deletions. "
+            )
+
+        created_insertion = None
+        for del_elem in del_elements:
+            runs = list(del_elem.iter(_w("r")))
+            if not runs:
+                continue
+
+            ins_elem = del_elem.makeelement(_w("ins"))
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                for del_text in new_run.iter(_w("delText")):
+                    del_text.tag = _w("t")
+                _swap_attribute(new_run, _w("rsidDel"), _w("rsidR"), self.rsid)
+                ins_elem.append(new_run)
+
+            nodes = [ins_elem]
+            self._place_nodes("insert_after", del_elem, nodes)
+            self._inject_attributes_to_nodes(nodes)
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+        """
+        tag = self._get_tag(elem)
+        if elem.tag == _w("r"):
+            if any(True for _ in elem.iter(_w("delText"))):
+                raise ValueError("w:r element already contains w:delText")
+
+            for t_elem in elem.iter(_w("t")):
+                t_elem.tag = _w("delText")
+            _swap_attribute(elem, _w("rsidR"), _w("rsidDel"), self.rsid)
+
+            # Wrap in w:del, keeping the text that followed the run outside it
+            del_wrapper = elem.makeelement(_w("del"))
+            tail, elem.tail = elem.tail, None
+            elem.addprevious(del_wrapper)
+            del_wrapper.append(elem)
+            del_wrapper.tail = tail
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif elem.tag == _w("p"):
+            if any(True for _ in elem.iter(_w("ins"), _w("del"))):
+                raise ValueError("w:p element already contains tracked changes")
+
+            pPr = next(elem.iter(_w("pPr")), None)
+            if pPr is not None and next(pPr.iter(_w("numPr")), None) is not None:
+                # Numbered list item: add <w:del/> to w:rPr in w:pPr
+                rPr = next(pPr.iter(_w("rPr")), None)
+                if rPr is None:
+                    rPr = lxml.etree.SubElement(pPr, _w("rPr"))
+                rPr.insert(0, rPr.makeelement(_w("del")))
+
+            for t_elem in elem.iter(_w("t")):
+                t_elem.tag = _w("delText")
+            for run in elem.iter(_w("r")):
+                _swap_attribute(run, _w("rsidR"), _w("rsidDel"), self.rsid)
+
+            # Wrap all non-pPr children in <w:del>
+            del_wrapper = elem.makeelement(_w("del"))
+            del_wrapper.extend(child for child in list(elem) if child.tag != _w("pPr"))
+            elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+
+def _w(name):
+    """Return the lxml tag or attribute name of a WordprocessingML name."""
+    return f"{{{NAMESPACES['w']}}}{name}"
+
+
+def _swap_attribute(elem, old_name, new_name, default):
+    """Rename old_name to new_name, or set new_name to default if neither is set."""
+    if old_name in elem.attrib:
+        elem.set(new_name, elem.attrib.pop(old_name))
+    elif new_name not in elem.attrib:
+        elem.set(new_name, default)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying it when hardlinks are not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _unlink_shared(path):
+    """Remove a file about to be rewritten if it is a hardlink shared with another path.
+
+    Writing to a hardlinked file would change every linked copy; removing it
+    first makes the rewrite create a file of its own.
+    """
+    path = Path(path)
+    if path.exists() and path.stat().st_nlink > 1:
+        path.unlink()
+
+
+def _changed_files(source_dir, target_dir):
+    """List files under source_dir that are missing or different in target_dir.
+
+    Files are compared by inode, then by size and modification time (which
+    copies made with shutil.copy2 keep), without reading their content.
+
+    Returns:
+        list[str]: Relative POSIX paths of the files to copy
+    """
+    changed = []
+    for source_file in sorted(Path(source_dir).rglob("*")):
+        if not source_file.is_file():
+            continue
+        relative_path = source_file.relative_to(source_dir).as_posix()
+        target_file = Path(target_dir) / relative_path
+        if target_file.exists():
+            source_stat = source_file.stat()
+            target_stat = target_file.stat()
+            if (source_stat.st_dev, source_stat.st_ino) == (
+                target_stat.st_dev,
+                target_stat.st_ino,
+            ) or (source_stat.st_size, source_stat.st_mtime_ns) == (
+                target_stat.st_size,
+                target_stat.st_mtime_ns,
+            ):
+                continue
+        changed.append(relative_path)
+    return changed
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -612,6 +1039,22 @@ def _generate_rsid() -> str:
 class Document:
     """Manages comments in unpacked Word documents."""
 
+    # Editor class for each backend accepted by __init__
+    EDITOR_BACKENDS = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+    # Parts Document maintains itself through the minidom API; they always use
+    # DocxXMLEditor whatever the backend
+    MANAGED_PARTS = {
+        "[Content_Types].xml",
+        "word/_rels/document.xml.rels",
+        "word/settings.xml",
+        "word/people.xml",
+        "word/comments.xml",
+        "word/commentsExtended.xml",
+        "word/commentsIds.xml",
+        "word/commentsExtensible.xml",
+    }
+
     def __init__(
         self,
         unpacked_dir,
@@ -619,6 +1062,8 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
+        overlay=False,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +1075,41 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: "minidom" (default) or "lxml". With "lxml", content parts such
+                as word/document.xml are opened with LxmlDocxXMLEditor, which is
+                much faster and smaller for large documents and returns lxml elements.
+            overlay: If True, the working copy hardlinks the files of unpacked_dir
+                instead of copying them, and only parts written by this session get
+                their own copy. Files under unpacked_path must then be replaced
+                (written as new files), never modified in place (default: False)
         """
+        if backend not in self.EDITOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend!r} (expected one of {sorted(self.EDITOR_BACKENDS)})"
+            )
+        self.backend = backend
+
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory holding the working copy of the unpacked content
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        if overlay:
+            shutil.copytree(
+                self.original_path, self.unpacked_path, copy_function=_link_or_copy
+            )
+        else:
+            shutil.copytree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline, read in place from the original directory; parts
+        # are preserved in memory before save() overwrites them there
+        self._baseline = BaselinePackage(self.original_path)
+
+        # Per-part validation indexes reused across saves for unchanged parts
+        self._validation_index = {}
 
         self.word_path = self.unpacked_path / "word"
 
@@ -657,6 +1123,8 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        # Parts written by earlier saves (editors are clean again after saving)
+        self._changed_parts = set()
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -664,9 +1132,8 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
+        # Load existing comments (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -704,8 +1171,15 @@ class Document:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            # Parts left unformatted by `unpack.py --lazy` are pretty-printed on
+            # first use, in the working copy only
+            format_lazy_part(self.unpacked_path, xml_path)
+            # Use the backend's editor with RSID, author, and initials
+            if xml_path in self.MANAGED_PARTS:
+                editor_class = DocxXMLEditor
+            else:
+                editor_class = self.EDITOR_BACKENDS[self.backend]
+            self._editors[xml_path] = editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -727,7 +1201,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
+        comment_id = self._get_next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -737,7 +1211,7 @@ class Document:
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
+        if self._document._get_tag(end) == "w:p":
             self._document.append_to(end, self._comment_range_end_xml(comment_id))
         else:
             self._document.insert_after(end, self._comment_range_end_xml(comment_id))
@@ -758,8 +1232,6 @@ class Document:
 
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,7 +1256,7 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self._get_next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -800,7 +1272,7 @@ class Document:
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document._get_parent(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -826,12 +1298,12 @@ class Document:
 
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
         return comment_id
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
+        if hasattr(self, "_baseline"):
+            self._baseline.close()
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
@@ -842,12 +1314,26 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
+        # Only parts changed through an editor can differ from the original
+        dirty_parts = self._changed_parts | {
+            xml_path for xml_path, editor in self._editors.items() if editor.dirty
+        }
+
+        # Create validators with current state (the baseline is shared across saves)
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_path,
+            verbose=False,
+            baseline=self._baseline,
+            dirty_parts=dirty_parts,
+            index_cache=self._validation_index,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_path,
+            verbose=False,
+            baseline=self._baseline,
+            dirty_parts=dirty_parts,
         )
 
         # Run validations
@@ -860,6 +1346,10 @@ class Document:
         """
         Save all modified XML files to disk and copy to destination directory.
 
+        Only editors whose dirty flag is set are serialized; parts that were
+        only read, even through nodes handed out by lookups, are left as they
+        are.
+
         This persists all changes made via add_comment() and reply_to_comment().
 
         Args:
@@ -871,35 +1361,40 @@ class Document:
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
+        # Save the modified XML files in temp directory; unchanged parts are skipped
+        for xml_path, editor in self._editors.items():
+            if not editor.dirty:
+                continue
+            self._changed_parts.add(xml_path)
+            _unlink_shared(editor.xml_path)
             editor.save()
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed files from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        changed = _changed_files(self.unpacked_path, target_path)
+        if target_path.resolve() == self.original_path.resolve():
+            self._baseline.preserve(changed)
+        for relative_path in changed:
+            target_file = target_path / relative_path
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            _unlink_shared(target_file)
+            shutil.copy2(self.unpacked_path / relative_path, target_file)
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
-        """Get the next available comment ID."""
+        """Reserve and return the next available comment ID.
+
+        IDs come from the id counter of the comments.xml editor, which scans
+        the part once and then hands out increasing IDs.
+        """
         if not self.comments_path.exists():
             return 0
-
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        return self["word/comments.xml"]._allocate_id("comment")
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
@@ -909,7 +1404,7 @@ class Document:
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
+        for comment_elem in editor._dom.getElementsByTagName("w:comment"):
             comment_id = comment_elem.getAttribute("w:id")
             if not comment_id:
                 continue
@@ -965,7 +1460,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,7 +1471,7 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         root_tag = root.tagName  # type: ignore
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
@@ -997,14 +1492,14 @@ class Document:
         - rsids: late (after compat)
         """
         editor = self["word/settings.xml"]
-        root = editor.get_node(tag="w:settings")
+        root = editor._dom.documentElement
         prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
             track_revisions_exists = any(
                 elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+                for elem in editor._dom.getElementsByTagName(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1012,7 +1507,7 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor._dom.getElementsByTagName(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
@@ -1025,7 +1520,7 @@ class Document:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor._dom.getElementsByTagName(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,13 +1531,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor._dom.getElementsByTagName(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
+                clr_elements = editor._dom.getElementsByTagName(
                     f"{prefix}:clrSchemeMapping"
                 )
                 if clr_elements:
@@ -1073,7 +1568,7 @@ class Document:
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        root = editor._dom.documentElement
 
         escaped_text = (
             text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -1096,7 +1591,7 @@ class Document:
             )
 
         editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
+        root = editor._dom.documentElement
 
         if parent_para_id:
             xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
@@ -1110,7 +1605,7 @@ class Document:
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+        root = editor._dom.documentElement
 
         xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
         editor.append_to(root, xml)
@@ -1123,7 +1618,7 @@ class Document:
             )
 
         editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        root = editor._dom.documentElement
 
         xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
         editor.append_to(root, xml)
@@ -1159,21 +1654,21 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
+        for rel_elem in editor._dom.getElementsByTagName("Relationship"):
             if rel_elem.getAttribute("Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
+        for override_elem in editor._dom.getElementsByTagName("Override"):
             if override_elem.getAttribute("PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
+        for person_elem in editor._dom.getElementsByTagName("w15:person"):
             if person_elem.getAttribute("w15:author") == author:
                 return True
         return False
@@ -1187,7 +1682,7 @@ class Document:
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
-        root = editor.get_node(tag="w15:people")
+        root = editor._dom.documentElement
 
         # Check if author already exists
         if self._has_author(editor, author):
@@ -1207,7 +1702,7 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         root_tag = root.tagName  # type: ignore
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
@@ -1247,7 +1742,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
 
         # Add Override elements
         overrides = [
@@ -16,6 +16,10 @@ Example usage:
     # Find node by text content
     elem = editor.get_node(tag="w:p", contains="specific text")
 
+    # Find every run holding some text, even when it is split across runs
+    for match in editor.find_text("specific text"):
+        print(match.paragraph, match.runs)
+
     # Find node by attributes
     elem = editor.get_node(tag="w:r", attrs={"w:id": "target"})
 
@@ -28,14 +32,53 @@ Example usage:
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor offers the same API on an lxml tree, for parts too large for minidom.
 """
 
+import bisect
+import contextlib
+import hashlib
 import html
+import io
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Local names of elements whose text is content even when it is only whitespace
+TEXT_ELEMENTS = {"t", "delText", "instrText", "delInstrText"}
+
+# Length of the character n-grams in the full-text index
+TEXT_GRAM_SIZE = 3
+
+# Namespace bound to the reserved "xml" prefix
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# Size of the write buffer used when saving, in bytes
+SAVE_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class TextMatch:
+    """One occurrence of a string in the text of a paragraph.
+
+    Attributes:
+        paragraph: The w:p element whose text contains the match
+        start: Offset of the match in the paragraph text
+        end: Offset just past the match in the paragraph text
+        runs: The w:r elements holding the matched characters, in document order
+    """
+
+    paragraph: object
+    start: int
+    end: int
+    runs: list = field(default_factory=list)
 
 
 class XMLEditor:
@@ -46,12 +89,42 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    Lookups are served from indexes (by tag, attribute value and line number,
+    plus an n-gram index of paragraph text) that are built on first use and
+    kept up to date by replace_node, insert_after, insert_before and
+    append_to. Results are checked against the DOM, so elements removed by
+    direct DOM edits are never returned, and once nodes have been handed out
+    a lookup that finds nothing in the indexes falls back to scanning the
+    DOM (rebuilding the indexes if the scan finds what they missed).
+
+    The dirty flag tells callers whether the part needs serializing. It is
+    set by every method that changes the tree and cleared by save(). Nodes
+    handed out by get_node, find_text, the insertion methods or the dom
+    attribute may be edited directly, so the first hand-out of an unchanged
+    tree takes a digest of its serialization, and dirty then compares the
+    tree against it; parts that were only read are still skipped.
+
+    Ids handed out by get_next_rid() come from a counter seeded by one scan
+    of the document; each id is reserved as it is returned, and ids found in
+    content inserted through the editor move the counter past them.
+
     Attributes:
+        PARAGRAPH_TAG: Tag of the elements indexed for text search
+        RUN_TAG: Tag of the elements reported by find_text
+        ID_COUNTERS: Id counters kept by the editor (see _allocate_id)
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True if the tree changed since it was parsed or last saved
     """
 
+    PARAGRAPH_TAG = "w:p"
+    RUN_TAG = "w:r"
+
+    # Id counters: name -> (tags of the elements carrying the id, id attribute,
+    # prefix before the number, first id handed out in an empty document)
+    ID_COUNTERS = {"rid": (("Relationship",), "Id", "rId", 1)}
+
     def __init__(self, xml_path):
         """
         Initialize with path to XML file and parse with line number tracking.
@@ -71,7 +144,55 @@ class XMLEditor:
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+
+        # Lookup indexes, built lazily by _get_index()
+        self._index = None
+
+        # Next free id per ID_COUNTERS entry, seeded on first use by _allocate_id()
+        self._next_ids = {}
+
+        self._dirty = False
+        self._nodes_handed_out = False
+        # Digest of the tree as loaded or last saved, taken once nodes are
+        # handed out (see _hand_out)
+        self._saved_digest = None
+
+    @property
+    def dom(self):
+        """The parsed tree, for direct manipulation (see the class docstring)."""
+        self._hand_out()
+        return self._dom
+
+    @property
+    def dirty(self):
+        """True unless the tree is known to match the file on disk."""
+        if self._dirty:
+            return True
+        if not self._nodes_handed_out:
+            return False
+        # Handed-out nodes may have been edited directly
+        return self._saved_digest is None or self._digest() != self._saved_digest
+
+    @dirty.setter
+    def dirty(self, value):
+        self._dirty = value
+
+    def _hand_out(self):
+        """Note that nodes of the tree are being returned to the caller.
+
+        If the tree still matches the file, its digest is taken first so that
+        dirty can later tell whether the caller changed anything.
+        """
+        if self._saved_digest is None and not self._dirty:
+            self._saved_digest = self._digest()
+        self._nodes_handed_out = True
+
+    def _digest(self):
+        """Return a digest of the tree as save() would serialize it."""
+        sink = _DigestWriter()
+        self._write_tree(sink)
+        return sink.digest()
 
     def get_node(
         self,
@@ -90,7 +211,8 @@ class XMLEditor:
             tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
             attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
-            contains: Text string that must appear in any text node within the element.
+            contains: Text string that must appear in the text of the element (its
+                      text nodes joined in document order, so it may span runs).
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
 
         Returns:
@@ -109,40 +231,20 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        matches = self._filter_nodes(
+            self._get_candidates(tag, attrs, line_number, contains),
+            attrs,
+            line_number,
+            contains,
+        )
+        if not matches and tag != "*" and self._index_may_be_stale():
+            # Direct DOM edits may have added the node or changed what it
+            # matches: scan the live tree, and rebuild the indexes if they missed it
+            matches = self._filter_nodes(
+                self._iter_tag(self._get_root(), tag), attrs, line_number, contains
+            )
+            if matches:
+                self.reindex()
 
         if not matches:
             # Build descriptive error message
@@ -178,30 +280,423 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        self._hand_out()
         return matches[0]
 
+    def _filter_nodes(self, elements, attrs, line_number, contains):
+        """Return the elements that pass every get_node filter, in order."""
+        matches = []
+        for elem in elements:
+            # Check line_number filter
+            if line_number is not None:
+                elem_line = self._get_line(elem)
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    self._get_attribute(elem, attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                elem_text = self._get_element_text(elem)
+                # Normalize the search string: convert HTML entities to Unicode characters
+                # This allows searching for both "&#8220;Rowan" and ""Rowan"
+                normalized_contains = html.unescape(contains)
+                if normalized_contains not in elem_text:
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
+    def _get_index(self):
+        """Return the lookup indexes, building them with one pass over the DOM.
+
+        The index is a dict with:
+            "tags": tag name -> {element: None} (an insertion-ordered set)
+            "attrs": attribute name -> (value -> {element: None}, element -> value),
+                     filled per attribute name on first query
+            "lines": (sorted start lines, elements in the same order) for the
+                     elements of the original file; new elements have no line
+            "fulltext": n-gram index of paragraph text, see _get_fulltext_index
+            "order": paragraph -> position in document order, see
+                     _get_paragraph_order
+        """
+        if self._index is None:
+            tags = {}
+            positioned = []
+            for elem in self._dom.getElementsByTagName("*"):
+                tags.setdefault(elem.tagName, {})[elem] = None
+                parse_pos = getattr(elem, "parse_position", None)
+                if parse_pos is not None:
+                    positioned.append((parse_pos[0], elem))
+            # getElementsByTagName yields document order, so lines are sorted
+            self._index = {
+                "tags": tags,
+                "attrs": {},
+                "lines": (
+                    [line for line, _ in positioned],
+                    [elem for _, elem in positioned],
+                ),
+                "fulltext": None,
+                "order": None,
+            }
+        return self._index
+
+    def _get_attr_index(self, attr_name):
+        """Return (value -> elements, element -> value) for one attribute name."""
+        index = self._get_index()
+        if attr_name not in index["attrs"]:
+            by_value = {}
+            by_elem = {}
+            for elements in index["tags"].values():
+                for elem in elements:
+                    value = elem.getAttribute(attr_name)
+                    by_value.setdefault(value, {})[elem] = None
+                    by_elem[elem] = value
+            index["attrs"][attr_name] = (by_value, by_elem)
+        return index["attrs"][attr_name]
+
+    def _index_may_be_stale(self):
+        """Return True if direct DOM edits may have outdated the indexes."""
+        return self._nodes_handed_out and self._index is not None
+
+    def _get_candidates(self, tag, attrs, line_number, contains=None):
+        """Return the elements that may match a get_node query.
+
+        Narrows by tag, then by the first attribute or the line range, and by
+        the paragraphs whose text contains the search string. The caller still
+        applies every filter to the candidates. Elements removed from the
+        document by direct DOM edits are dropped here and from the indexes.
+        """
+        candidates = []
+        for elem in self._get_indexed_candidates(tag, attrs, line_number, contains):
+            if self._is_attached(elem):
+                candidates.append(elem)
+            else:
+                self._unindex_node(elem)
+        return candidates
+
+    def _get_indexed_candidates(self, tag, attrs, line_number, contains=None):
+        """Return the candidates for _get_candidates as found in the indexes."""
+        if tag == "*":
+            return self._dom.getElementsByTagName(tag)
+
+        index = self._get_index()
+        live = index["tags"].get(tag, {})
+
+        if contains is not None and not attrs:
+            paragraphs = self._paragraphs_containing(html.unescape(contains))
+            if tag == self.PARAGRAPH_TAG and line_number is None:
+                return [p for p in paragraphs if p in live]
+            # Text inside a paragraph is part of the paragraph's text
+            paragraphs = set(paragraphs)
+            paragraphs.add(None)
+            return [
+                e
+                for e in self._get_indexed_candidates(tag, attrs, line_number)
+                if self._find_ancestor(e, self.PARAGRAPH_TAG) in paragraphs
+            ]
+
+        if attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            by_value, _ = self._get_attr_index(attr_name)
+            return [e for e in by_value.get(attr_value, ()) if e in live]
+
+        if line_number is not None:
+            lines, elements = index["lines"]
+            if isinstance(line_number, range):
+                if line_number.step != 1:
+                    return list(live)
+                start, stop = line_number.start, line_number.stop
+            else:
+                start, stop = line_number, line_number + 1
+            lo = bisect.bisect_left(lines, start)
+            hi = bisect.bisect_left(lines, stop)
+            return [e for e in elements[lo:hi] if e in live]
+
+        return list(live)
+
+    def _is_attached(self, node):
+        """Return True if node is still part of the document."""
+        while node is not None:
+            if node is self._dom:
+                return True
+            node = node.parentNode
+        return False
+
+    def _invalidate_text(self, node):
+        """Queue the paragraphs containing a node for re-indexing."""
+        while node is not None:
+            self._mark_paragraph_dirty(node)
+            node = node.parentNode
+
+    def _mark_paragraph_dirty(self, node):
+        """Queue a paragraph for re-indexing in the full-text index."""
+        fulltext = self._index["fulltext"]
+        if (
+            fulltext is not None
+            and node.nodeType == node.ELEMENT_NODE
+            and node.tagName == self.PARAGRAPH_TAG
+        ):
+            fulltext["dirty"][node] = None
+
+    def _find_ancestor(self, node, tag):
+        """Return the nearest element with the given tag that is node or an ancestor."""
+        while node is not None:
+            if node.nodeType == node.ELEMENT_NODE and node.tagName == tag:
+                return node
+            node = node.parentNode
+        return None
+
+    def _get_fulltext_index(self):
+        """Return the full-text index of paragraph text, refreshing stale entries.
+
+        The index is a dict with:
+            "paragraphs": paragraph -> (text, start offsets, text nodes), where
+                          text is _get_element_text(paragraph) and each text node
+                          begins at the start offset with the same position
+            "grams": n-gram of TEXT_GRAM_SIZE characters -> {paragraph: None}
+            "dirty": paragraphs to re-index before the next query
+        """
+        index = self._get_index()
+        fulltext = index["fulltext"]
+        live = index["tags"].get(self.PARAGRAPH_TAG, {})
+        if fulltext is None:
+            fulltext = {"paragraphs": {}, "grams": {}, "dirty": dict.fromkeys(live)}
+            index["fulltext"] = fulltext
+
+        paragraphs = fulltext["paragraphs"]
+        grams = fulltext["grams"]
+        for paragraph in fulltext["dirty"]:
+            old = paragraphs.pop(paragraph, None)
+            if old is not None:
+                for gram in _text_grams(old[0]):
+                    grams[gram].pop(paragraph, None)
+            if paragraph not in live:
+                continue
+            nodes = self._get_text_nodes(paragraph)
+            starts = []
+            offset = 0
+            for node in nodes:
+                starts.append(offset)
+                offset += len(node.data)
+            text = "".join(node.data for node in nodes)
+            paragraphs[paragraph] = (text, starts, nodes)
+            for gram in _text_grams(text):
+                grams.setdefault(gram, {})[paragraph] = None
+        fulltext["dirty"].clear()
+        return fulltext
+
+    def _paragraphs_containing(self, text):
+        """Return the paragraphs whose text contains text, using the n-gram index.
+
+        Once nodes have been handed out, each hit is checked against the DOM:
+        paragraphs removed or edited directly are re-indexed and the search
+        is repeated.
+        """
+        fulltext = self._get_fulltext_index()
+        paragraphs = fulltext["paragraphs"]
+        if len(text) < TEXT_GRAM_SIZE:
+            candidates = paragraphs
+        else:
+            # Intersect posting lists, starting from the rarest n-gram
+            postings = sorted(
+                (fulltext["grams"].get(gram, {}) for gram in _text_grams(text)),
+                key=len,
+            )
+            candidates = [
+                p for p in postings[0] if all(p in posting for posting in postings[1:])
+            ]
+        found = [p for p in candidates if text in paragraphs[p][0]]
+        if not self._nodes_handed_out:
+            return found
+
+        stale = False
+        for paragraph in found:
+            para_text, _, nodes = paragraphs[paragraph]
+            if not self._is_attached(paragraph):
+                self._unindex_node(paragraph)
+                stale = True
+            elif nodes != self._get_text_nodes(paragraph) or para_text != "".join(
+                node.data for node in nodes
+            ):
+                fulltext["dirty"][paragraph] = None
+                stale = True
+        return self._paragraphs_containing(text) if stale else found
+
+    def _get_paragraph_order(self, paragraphs):
+        """Return paragraph -> position in document order, covering paragraphs.
+
+        Built with one pass over the DOM, and rebuilt only when one of the
+        given paragraphs was inserted since.
+        """
+        index = self._get_index()
+        order = index["order"]
+        if order is None or any(p not in order for p in paragraphs):
+            order = {
+                p: i
+                for i, p in enumerate(
+                    self._dom.getElementsByTagName(self.PARAGRAPH_TAG)
+                )
+            }
+            index["order"] = order
+        return order
+
+    def find_text(self, text):
+        """
+        Find every occurrence of a string in the text of the document's paragraphs.
+
+        Paragraph text is the concatenation of its text nodes, so matches may
+        span several runs. Uses an n-gram index built once per editor and kept
+        up to date as the document is edited.
+
+        Args:
+            text: String to search for. Supports both entity notation (&#8220;)
+                  and Unicode characters (\u201c).
+
+        Returns:
+            list[TextMatch]: All matches, in document order. Text in nested
+            paragraphs (e.g. text boxes) is also matched in the enclosing one.
+
+        Raises:
+            ValueError: If text is empty
+
+        Example:
+            for match in editor.find_text("Agreement"):
+                editor.suggest_deletion(match.runs[0])
+        """
+        text = html.unescape(text)
+        if not text:
+            raise ValueError("Search text must not be empty")
+
+        paragraphs = self._paragraphs_containing(text)
+        if not paragraphs and self._index_may_be_stale():
+            # Paragraphs added or edited by direct DOM edits are not indexed yet
+            if any(
+                text in self._get_element_text(paragraph)
+                for paragraph in self._iter_tag(self._get_root(), self.PARAGRAPH_TAG)
+            ):
+                self.reindex()
+                paragraphs = self._paragraphs_containing(text)
+        if len(paragraphs) > 1:
+            paragraphs.sort(key=self._get_paragraph_order(paragraphs).__getitem__)
+
+        entries = self._get_fulltext_index()["paragraphs"]
+        matches = []
+        for paragraph in paragraphs:
+            para_text, starts, nodes = entries[paragraph]
+            start = para_text.find(text)
+            while start != -1:
+                end = start + len(text)
+                first = bisect.bisect_right(starts, start) - 1
+                last = bisect.bisect_left(starts, end)
+                runs = []
+                for node in nodes[first:last]:
+                    run = self._find_ancestor(node, self.RUN_TAG)
+                    if run is not None and run not in runs:
+                        runs.append(run)
+                matches.append(TextMatch(paragraph, start, end, runs))
+                start = para_text.find(text, start + 1)
+        if matches:
+            self._hand_out()
+        return matches
+
+    def _index_nodes(self, nodes):
+        """Add (or refresh) nodes and their descendants in the lookup indexes.
+
+        Call after nodes were inserted into the DOM or had attributes changed.
+        """
+        if self._index is None:
+            return
+        tags = self._index["tags"]
+        attrs = self._index["attrs"]
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            self._invalidate_text(node)
+            for elem in [node, *node.getElementsByTagName("*")]:
+                tags.setdefault(elem.tagName, {})[elem] = None
+                self._mark_paragraph_dirty(elem)
+                for attr_name, (by_value, by_elem) in attrs.items():
+                    value = elem.getAttribute(attr_name)
+                    old_value = by_elem.get(elem)
+                    if old_value == value:
+                        continue
+                    if old_value is not None:
+                        by_value[old_value].pop(elem, None)
+                    by_value.setdefault(value, {})[elem] = None
+                    by_elem[elem] = value
+
+    def _unindex_node(self, node):
+        """Remove a node and its descendants from the lookup indexes.
+
+        Call before the node is detached from the DOM.
+        """
+        if self._index is None or node.nodeType != node.ELEMENT_NODE:
+            return
+        tags = self._index["tags"]
+        attrs = self._index["attrs"]
+        self._invalidate_text(node)
+        for elem in [node, *node.getElementsByTagName("*")]:
+            tags.get(elem.tagName, {}).pop(elem, None)
+            self._mark_paragraph_dirty(elem)
+            for by_value, by_elem in attrs.values():
+                value = by_elem.pop(elem, None)
+                if value is not None:
+                    by_value[value].pop(elem, None)
+
+    def reindex(self):
+        """
+        Discard the lookup indexes; they are rebuilt on the next lookup.
+
+        Lookups already rescan the DOM when the indexes find nothing after
+        direct edits. Call this after direct edits that add or move elements,
+        or change attributes or text, when other matches may exist as well
+        (so get_node reports every candidate and find_text keeps document
+        order).
+        """
+        self._index = None
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
-        which typically represent XML formatting rather than document content.
+        which typically represent XML formatting rather than document content,
+        unless they are the content of a text element such as w:t.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
 
         Returns:
-            str: Concatenated text from all non-whitespace text nodes within the element
+            str: Concatenated text from all content text nodes within the element
         """
-        text_parts = []
+        return "".join(node.data for node in self._get_text_nodes(elem))
+
+    def _get_text_nodes(self, elem):
+        """Return the text nodes that make up _get_element_text(elem), in order."""
+        is_text_element = elem.tagName.split(":")[-1] in TEXT_ELEMENTS
+        text_nodes = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
                 # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
+                if is_text_element or node.data.strip():
+                    text_nodes.append(node)
             elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+                text_nodes.extend(self._get_text_nodes(node))
+        return text_nodes
 
     def replace_node(self, elem, new_content):
         """
@@ -217,11 +712,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
+        self._place_nodes("replace_node", elem, nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -238,14 +730,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
+        self._place_nodes("insert_after", elem, nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -262,10 +748,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
+        self._place_nodes("insert_before", elem, nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -283,31 +767,139 @@ class XMLEditor:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        self._place_nodes("append_to", elem, nodes)
         return nodes
 
+    def _place_nodes(self, operation, elem, nodes):
+        """Put imported fragment nodes into the DOM and update the indexes.
+
+        Args:
+            operation: "replace_node", "insert_after", "insert_before" or "append_to"
+            elem: Element the operation is relative to
+            nodes: Nodes returned by _parse_fragment
+        """
+        self.dirty = True
+        self._hand_out()
+        if operation == "append_to":
+            for node in nodes:
+                elem.appendChild(node)
+        else:
+            parent = elem.parentNode
+            reference = elem.nextSibling if operation == "insert_after" else elem
+            if operation == "replace_node":
+                self._unindex_node(elem)
+            for node in nodes:
+                if reference:
+                    parent.insertBefore(node, reference)
+                else:
+                    parent.appendChild(node)
+            if operation == "replace_node":
+                parent.removeChild(elem)
+        self._index_nodes(nodes)
+        self._reserve_ids(nodes)
+
     def get_next_rid(self):
-        """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        """Get the next available rId for relationships files.
+
+        The returned id is reserved: later calls return higher ids even before
+        a Relationship using it has been added.
+        """
+        return f"rId{self._allocate_id('rid')}"
+
+    def _allocate_id(self, name):
+        """Return the next number from an ID_COUNTERS counter and reserve it.
+
+        The counter is seeded with one scan of the document the first time it
+        is used; after that each call is O(1).
+
+        Args:
+            name: Key of the counter in ID_COUNTERS
+
+        Returns:
+            int: An id number not used by any element the counter tracks
+        """
+        if name not in self._next_ids:
+            tags, attr_name, prefix, first_id = self.ID_COUNTERS[name]
+            next_id = first_id
+            for tag in tags:
+                for elem in self._iter_tag(self._get_root(), tag):
+                    number = _parse_id(self._get_attribute(elem, attr_name), prefix)
+                    if number is not None:
+                        next_id = max(next_id, number + 1)
+            self._next_ids[name] = next_id
+        next_id = self._next_ids[name]
+        self._next_ids[name] = next_id + 1
+        return next_id
+
+    def _reserve_ids(self, nodes):
+        """Move seeded id counters past the ids used in newly inserted nodes."""
+        for name, next_id in self._next_ids.items():
+            tags, attr_name, prefix, _ = self.ID_COUNTERS[name]
+            for node in nodes:
+                for tag in tags:
+                    for elem in self._iter_tag(node, tag):
+                        attr_value = self._get_attribute(elem, attr_name)
+                        number = _parse_id(attr_value, prefix)
+                        if number is not None and number >= next_id:
+                            next_id = number + 1
+            self._next_ids[name] = next_id
+
+    def _get_root(self):
+        """Return the document element."""
+        return self._dom.documentElement
+
+    def _get_line(self, elem):
+        """Return the line an element starts on in the original file, or None."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _get_attribute(self, elem, attr_name):
+        """Return an attribute value by qualified name ("" if it is not set)."""
+        return elem.getAttribute(attr_name)
+
+    def _get_tag(self, elem):
+        """Return the qualified tag name of an element (e.g. "w:p")."""
+        return elem.tagName
+
+    def _get_parent(self, elem):
+        """Return the parent of an element."""
+        return elem.parentNode
+
+    def _is_element(self, node):
+        """Return True if node is an element (not text, a comment, ...)."""
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _iter_tag(self, node, tag):
+        """Yield node and its descendants with the given tag, in document order."""
+        if not self._is_element(node):
+            return
+        if node.tagName == tag:
+            yield node
+        yield from node.getElementsByTagName(tag)
 
     def save(self):
         """
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The output is
+        streamed to a temporary file in chunks, never held in memory as a
+        whole, and renamed over the original once complete.
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        with _replace_file(self.xml_path) as f:
+            # Same writer as minidom's toxml(encoding=...), but backed by the file
+            writer = io.TextIOWrapper(
+                f, encoding=self.encoding, errors="xmlcharrefreplace", newline="\n"
+            )
+            tee = _DigestWriter(writer)
+            self._write_tree(tee)
+            writer.flush()
+            writer.detach()
+        self._saved_digest = tee.digest()
+        self.dirty = False
+
+    def _write_tree(self, out):
+        """Serialize the tree to out, an object with a write() method."""
+        self._dom.writexml(out, encoding=self.encoding)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,8 +914,23 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments in one wrapper document.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List with, for each fragment, the list of nodes imported into this document
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
         # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
+        root_elem = self._dom.documentElement
         namespaces = []
         if root_elem and root_elem.attributes:
             for i in range(root_elem.attributes.length):
@@ -332,15 +939,407 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
-        return nodes
+        body = "".join(f"<fragment>{content}</fragment>" for content in xml_contents)
+        try:
+            wrapper_doc = defusedxml.minidom.parseString(
+                f"<root {ns_decl}>{body}</root>"
+            )
+            fragment_elems = wrapper_doc.documentElement.childNodes  # type: ignore
+        except Exception:
+            if len(xml_contents) == 1:
+                raise
+            # Parse one at a time so the error points at the broken fragment
+            return [self._parse_fragment(content) for content in xml_contents]
+        assert len(fragment_elems) == len(xml_contents), "Malformed fragment"
+
+        fragments = []
+        for fragment_elem in fragment_elems:
+            nodes = [
+                self._dom.importNode(child, deep=True)
+                for child in fragment_elem.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            fragments.append(nodes)
+        return fragments
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    Offers the same public API (get_node, find_text, replace_node, insert_after,
+    insert_before, append_to, get_next_rid, reindex, save) but returns lxml
+    elements. Line numbers come from lxml's own sourceline, and the tree is far
+    smaller and faster to parse than a minidom DOM, which makes this backend
+    the better choice for very large parts. Tag and attribute names are still given with
+    the prefixes declared on the document element (e.g. "w:p", "w:id").
+
+    Lookups walk the tree in C instead of using the indexes XMLEditor keeps.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        dom (lxml.etree._ElementTree): Parsed tree; elements carry sourceline
+        dirty: True if the tree changed since it was parsed or last saved
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist or declares entities
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+
+        self._dom = lxml.etree.parse(str(self.xml_path), _create_lxml_parser())
+        dtd = self._dom.docinfo.internalDTD
+        if dtd is not None and any(True for _ in dtd.iterentities()):
+            raise ValueError(f"Entity declarations are not allowed: {xml_path}")
+
+        self._next_ids = {}
+        self._dirty = False
+        self._nodes_handed_out = False
+        self._saved_digest = None
+
+    def _get_candidates(self, tag, attrs, line_number, contains=None):
+        """Return the elements with the given tag; get_node applies the filters."""
+        if tag == "*":
+            return [e for e in self._dom.iter() if isinstance(e.tag, str)]
+        return list(self._dom.iter(self._clark_name(tag)))
+
+    def _get_element_text(self, elem):
+        """Return the text of an element, skipping formatting whitespace."""
+        return "".join(text for text, _ in self._get_text_pieces(elem))
+
+    def _get_text_pieces(self, elem):
+        """Return (text, element holding it) for the text making up elem's text.
+
+        Whitespace-only text is skipped unless it is the content of a text
+        element such as w:t, as in XMLEditor._get_text_nodes.
+        """
+        pieces = []
+        stack = [elem]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, tuple):
+                pieces.append(item)
+                continue
+            keep_whitespace = lxml.etree.QName(item).localname in TEXT_ELEMENTS
+            if item.text and (keep_whitespace or item.text.strip()):
+                pieces.append((item.text, item))
+            # Children and their tails, pushed in reverse for document order
+            for child in reversed(item):
+                if child.tail and (keep_whitespace or child.tail.strip()):
+                    stack.append((child.tail, item))
+                if isinstance(child.tag, str):
+                    stack.append(child)
+        return pieces
+
+    def find_text(self, text):
+        """
+        Find every occurrence of a string in the text of the document's paragraphs.
+
+        Same behaviour as XMLEditor.find_text, computed with a scan of the
+        paragraphs instead of an n-gram index.
+
+        Args:
+            text: String to search for. Supports both entity notation (&#8220;)
+                  and Unicode characters (\u201c).
+
+        Returns:
+            list[TextMatch]: All matches, in document order
+
+        Raises:
+            ValueError: If text is empty
+        """
+        text = html.unescape(text)
+        if not text:
+            raise ValueError("Search text must not be empty")
+
+        run_tag = self._clark_name(self.RUN_TAG)
+        matches = []
+        for paragraph in self._dom.iter(self._clark_name(self.PARAGRAPH_TAG)):
+            pieces = self._get_text_pieces(paragraph)
+            para_text = "".join(piece for piece, _ in pieces)
+            start = para_text.find(text)
+            if start == -1:
+                continue
+            starts = []
+            offset = 0
+            for piece, _ in pieces:
+                starts.append(offset)
+                offset += len(piece)
+            while start != -1:
+                end = start + len(text)
+                first = bisect.bisect_right(starts, start) - 1
+                last = bisect.bisect_left(starts, end)
+                runs = []
+                for _, holder in pieces[first:last]:
+                    if holder.tag == run_tag:
+                        run = holder
+                    else:
+                        run = next(holder.iterancestors(run_tag), None)
+                    if run is not None and run not in runs:
+                        runs.append(run)
+                matches.append(TextMatch(paragraph, start, end, runs))
+                start = para_text.find(text, start + 1)
+        if matches:
+            self._hand_out()
+        return matches
+
+    def _place_nodes(self, operation, elem, nodes):
+        """Put parsed fragment elements into the tree.
+
+        Text between the fragment's elements travels as their tails; the text
+        that followed elem stays after the inserted content.
+        """
+        self.dirty = True
+        self._hand_out()
+        lead = getattr(nodes, "lead", None)
+        if operation == "append_to":
+            if len(elem):
+                elem[-1].tail = (elem[-1].tail or "") + (lead or "")
+            else:
+                elem.text = (elem.text or "") + (lead or "")
+            elem.extend(nodes)
+        elif operation == "insert_after":
+            nodes[-1].tail = (nodes[-1].tail or "") + (elem.tail or "")
+            elem.tail = lead
+            for node in reversed(nodes):
+                elem.addnext(node)
+        else:
+            _append_text_before(elem, lead)
+            for node in nodes:
+                elem.addprevious(node)
+            if operation == "replace_node":
+                nodes[-1].tail = (nodes[-1].tail or "") + (elem.tail or "")
+                elem.getparent().remove(elem)
+        self._reserve_ids(nodes)
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments in one wrapper document.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List with, for each fragment, the list of its top-level elements.
+            Text before the first element is kept in the list's "lead" attribute.
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self._get_root().nsmap.items()
+        )
+        body = "".join(f"<fragment>{content}</fragment>" for content in xml_contents)
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{body}</root>".encode(), _create_lxml_parser()
+        )
+        fragments = []
+        for fragment_elem in wrapper:
+            nodes = _Fragment(fragment_elem)
+            nodes.lead = fragment_elem.text
+            elements = [n for n in nodes if isinstance(n.tag, str)]
+            assert elements, "Fragment must contain at least one element"
+            # Fragment line numbers are meaningless in the edited file
+            for node in nodes:
+                for descendant in node.iter():
+                    descendant.sourceline = 0
+            fragments.append(nodes)
+        assert len(fragments) == len(xml_contents), "Malformed fragment"
+        return fragments
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Serializes the tree and writes it back to the original file path,
+        preserving the original encoding (ascii or utf-8). Like XMLEditor.save,
+        the output is streamed to a temporary file that replaces the original.
+        """
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        with _replace_file(self.xml_path) as f:
+            f.write(declaration.encode(self.encoding))
+            tee = _DigestWriter(f)
+            self._write_tree(tee)
+        self._saved_digest = tee.digest()
+        self.dirty = False
+
+    def _write_tree(self, out):
+        self._dom.write(out, encoding=self.encoding)
+
+    def _get_root(self):
+        return self._dom.getroot()
+
+    def _get_line(self, elem):
+        return elem.sourceline
+
+    def _get_attribute(self, elem, attr_name):
+        return elem.get(self._clark_name(attr_name, attribute=True), "")
+
+    def _get_tag(self, elem):
+        qname = lxml.etree.QName(elem)
+        return f"{elem.prefix}:{qname.localname}" if elem.prefix else qname.localname
+
+    def _get_parent(self, elem):
+        return elem.getparent()
+
+    def _is_element(self, node):
+        return isinstance(node.tag, str)
+
+    def _iter_tag(self, node, tag):
+        if self._is_element(node):
+            yield from node.iter(self._clark_name(tag))
+
+    def _index_nodes(self, nodes):
+        pass
+
+    def _unindex_node(self, node):
+        pass
+
+    def reindex(self):
+        """Do nothing: lookups always walk the live tree."""
+
+    def _index_may_be_stale(self):
+        return False
+
+    def _clark_name(self, name, attribute=False):
+        """Turn a prefixed name such as "w:p" into lxml's "{namespace}p" form.
+
+        Unprefixed attribute names have no namespace; unprefixed tags use the
+        default namespace of the document element.
+
+        Raises:
+            ValueError: If the prefix is not declared on the document element
+        """
+        prefix, _, local = name.rpartition(":")
+        if prefix == "xml":
+            return f"{{{XML_NAMESPACE}}}{local}"
+        if not prefix and attribute:
+            return local
+        uri = self._get_root().nsmap.get(prefix or None)
+        if uri is None:
+            if prefix:
+                raise ValueError(f"Namespace prefix not declared: {prefix}")
+            return local
+        return f"{{{uri}}}{local}"
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the document element if it is missing.
+
+        lxml cannot add declarations to an existing element, so the document
+        element is rebuilt with the extra declaration and its content moved
+        over.
+        """
+        root = self._get_root()
+        if root.nsmap.get(prefix) == uri:
+            return
+        new_root = lxml.etree.Element(
+            root.tag, attrib=dict(root.attrib), nsmap={**root.nsmap, prefix: uri}
+        )
+        new_root.text = root.text
+        new_root.extend(root)
+        new_root.sourceline = root.sourceline
+        self._dom._setroot(new_root)
+        self.dirty = True
+
+
+class _Fragment(list):
+    """Elements of a parsed fragment, plus the text that preceded them."""
+
+    lead = None
+
+
+def _append_text_before(elem, text):
+    """Add text in front of elem (to the previous sibling's tail or parent text)."""
+    if not text:
+        return
+    previous = elem.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+    else:
+        parent = elem.getparent()
+        parent.text = (parent.text or "") + text
+
+
+class _DigestWriter:
+    """File-like sink that hashes what is written, optionally passing it on."""
+
+    def __init__(self, target=None):
+        self._hash = hashlib.blake2b()
+        self._target = target
+
+    def write(self, data):
+        if isinstance(data, str):
+            self._hash.update(data.encode("utf-8", "surrogatepass"))
+        else:
+            self._hash.update(data)
+        if self._target is not None:
+            self._target.write(data)
+
+    def digest(self):
+        return self._hash.digest()
+
+
+@contextlib.contextmanager
+def _replace_file(path):
+    """Open a buffered temporary file that atomically replaces path when closed.
+
+    The temporary file is created next to path and takes over its permission
+    bits. If the block raises, the temporary file is removed and path is left
+    untouched.
+
+    Yields:
+        BinaryIO: File to write the new content to
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with open(fd, "wb", buffering=SAVE_CHUNK_SIZE) as f:
+            yield f
+        if path.exists():
+            os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+def _create_lxml_parser():
+    """Create an lxml parser that never expands entities or loads DTDs."""
+    return lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False, huge_tree=True
+    )
+
+
+def _parse_id(value, prefix):
+    """Return the number in an id like "rId7" (prefix "rId"), or None."""
+    if not value.startswith(prefix):
+        return None
+    try:
+        return int(value[len(prefix) :])
+    except ValueError:
+        return None
+
+
+def _text_grams(text):
+    """Return the distinct n-grams of TEXT_GRAM_SIZE characters in text."""
+    return {text[i : i + TEXT_GRAM_SIZE] for i in range(len(text) - TEXT_GRAM_SIZE + 1)}
 
 
 def _create_line_tracking_parser():
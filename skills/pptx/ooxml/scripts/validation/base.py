@@ -2,13 +2,68 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
 import re
 from pathlib import Path
 
 import lxml.etree
 
+from .baseline import BaselinePackage
+from .results import CheckRecorder, check
 
-class BaseSchemaValidator:
+try:
+    from ..unpack import LAZY_MANIFEST
+except ImportError:  # validation imported as a top-level package by validate.py
+    from unpack import LAZY_MANIFEST
+
+# Directory holding the bundled XSD schemas
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
+# Compiled XSD schemas shared by all validators in this process: path -> XMLSchema
+_SCHEMA_CACHE = {}
+
+
+def _load_schema(schema_path):
+    """Return the compiled XMLSchema for schema_path, compiling it once per process.
+
+    Schemas that fail to compile are cached as well, and the same error is
+    raised again on every later lookup.
+    """
+    schema_path = Path(schema_path)
+    if schema_path not in _SCHEMA_CACHE:
+        try:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                _SCHEMA_CACHE[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            _SCHEMA_CACHE[schema_path] = e
+    schema = _SCHEMA_CACHE[schema_path]
+    if isinstance(schema, Exception):
+        raise schema
+    return schema
+
+
+# Validator owned by each worker process of a parallel XSD run
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_cls, unpacked_dir, original_file, baseline, dirty_parts):
+    """Create the validator used by this worker process (with its own schema cache)."""
+    global _worker_validator
+    _worker_validator = validator_cls(
+        unpacked_dir, original_file, baseline=baseline, dirty_parts=dirty_parts
+    )
+
+
+def _validate_file_in_worker(xml_file):
+    """Validate one part against its XSD in a worker process."""
+    return _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
+
+
+class BaseSchemaValidator(CheckRecorder):
     """Base validator with common validation logic for document files."""
 
     # Elements whose 'id' attributes must be unique within their file
@@ -103,13 +158,37 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        baseline=None,
+        jobs=1,
+        dirty_parts=None,
+        index_cache=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Parts changed since the original (paths relative to unpacked_dir, e.g.
+        # "word/document.xml"). Per-part checks only look at these; None means
+        # every part is checked.
+        self.dirty_parts = (
+            {Path(part).as_posix() for part in dirty_parts}
+            if dirty_parts is not None
+            else None
+        )
+
+        # Number of worker processes used for XSD validation
+        self.jobs = max(1, jobs)
+
+        # Original package, optionally shared with other validators in this run
+        self.baseline = baseline or BaselinePackage(self.original_file)
+
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = SCHEMAS_DIR
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
@@ -120,18 +199,209 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Per-file results shared by all checks (parsed trees, rule results, ...):
+        # (kind, path) -> (mtime_ns, size, value)
+        self._file_cache = {}
+
+        # Lightweight per-file indexes (ID scans, relationships, root tags) that
+        # callers may share across validator instances to skip unchanged parts
+        self._index_cache = index_cache if index_cache is not None else {}
+        if self.dirty_parts is not None:
+            # Never trust an index for a part known to have changed
+            for kind, path in list(self._index_cache):
+                if self._is_dirty(path):
+                    del self._index_cache[(kind, path)]
+
+        # Clark-notation tag -> (tag, attribute, scope) from UNIQUE_ID_REQUIREMENTS
+        self._id_rules = {}
+
+        # CheckResult for every check run, in order (see results.py)
+        self.results = []
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    @classmethod
+    def preload_schemas(cls):
+        """Compile every mapped XSD schema ahead of time.
+
+        Compiled schemas live in a process-wide cache, so a long-running worker
+        that calls this once pays the compilation cost only on startup.
+        """
+        for schema_name in sorted(set(cls.SCHEMA_MAPPINGS.values())):
+            try:
+                _load_schema(SCHEMAS_DIR / schema_name)
+            except Exception:
+                # Reported per file when a part using this schema is validated
+                continue
+
+    def _is_dirty(self, xml_file):
+        """Return True if per-part checks should run on xml_file."""
+        if self.dirty_parts is None:
+            return True
+        relative_path = Path(xml_file).relative_to(self.unpacked_dir)
+        return relative_path.as_posix() in self.dirty_parts
+
+    def _changed_xml_files(self):
+        """Return the XML files that per-part checks should visit."""
+        return [f for f in self.xml_files if self._is_dirty(f)]
+
+    def _cached_for_file(self, kind, xml_file, compute, index=False):
+        """Return compute(xml_file), cached per kind of result and file.
+
+        Entries are keyed on the file's modification time and size, so a file
+        rewritten between checks is processed again. Small results that stay
+        valid across validation runs are stored in the shared index cache when
+        index is True.
+        """
+        cache = self._index_cache if index else self._file_cache
+        xml_file = Path(xml_file)
+        stat = xml_file.stat()
+        cached = cache.get((kind, xml_file))
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        value = compute(xml_file)
+        cache[(kind, xml_file)] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
+
+    def _read_relationships(self, rels_file):
+        """Index the Relationship entries of a .rels file.
+
+        Returns:
+            list: (id, type, target, line) tuples in document order
+        """
+
+        def read(path):
+            rels_root = self._parse_xml(path).getroot()
+            return [
+                (rel.get("Id"), rel.get("Type", ""), rel.get("Target"), rel.sourceline)
+                for rel in rels_root.findall(
+                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+                )
+            ]
+
+        return self._cached_for_file("rels", rels_file, read, index=True)
+
+    def _get_root_tag(self, xml_file):
+        """Return the root element tag of an XML file, reading only its start."""
+
+        def read(path):
+            for _, elem in lxml.etree.iterparse(str(path), events=("start",)):
+                return elem.tag
+
+        return self._cached_for_file("root_tag", xml_file, read, index=True)
+
+    def _parse_xml(self, xml_file, mutable=False):
+        """Parse an XML file once and share the tree across all checks.
+
+        Trees are cached by path and keyed on modification time and size, so a
+        file rewritten between checks is parsed again. Checks that modify the
+        tree must pass mutable=True to get a private copy of the shared tree.
+
+        Args:
+            xml_file: Path to the XML file to parse
+            mutable: If True, return a deep copy that may be modified freely
+
+        Returns:
+            lxml.etree._ElementTree: The parsed document
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        tree = self._cached_for_file(
+            "tree", xml_file, lambda path: lxml.etree.parse(str(path))
+        )
+        return copy.deepcopy(tree) if mutable else tree
+
+    def _get_id_rule(self, tag):
+        """Look up the UNIQUE_ID_REQUIREMENTS rule for a Clark-notation tag.
+
+        Returns:
+            tuple: (tag, attribute_name, scope) or None if the element has no rule
+        """
+        if tag not in self._id_rules:
+            local = tag.split("}")[-1].lower()
+            rule = self.UNIQUE_ID_REQUIREMENTS.get(local)
+            self._id_rules[tag] = (local, *rule) if rule else None
+        return self._id_rules[tag]
+
+    def _scan_ids(self, xml_file):
+        """Collect unique-ID candidates and r:id references in one streaming pass.
+
+        The file is read with iterparse and each element is cleared once it has
+        been seen, so memory stays flat on large parts. Every element costs one
+        rule lookup and one r:id lookup. Elements inside mc:AlternateContent are
+        ignored for ID uniqueness but still checked for relationship references.
+        Results are cached by path, modification time and size.
+
+        Args:
+            xml_file: Path to the XML file to scan
+
+        Returns:
+            dict: "ids" -> list of (tag, attr_name, scope, id_value, line),
+                  "rids" -> list of (element_name, rid, line),
+                  "elements" -> number of elements read,
+                  "error" -> exception raised while reading the file, or None
+        """
+        return self._cached_for_file("ids", xml_file, self._stream_ids, index=True)
+
+    def _stream_ids(self, xml_file):
+        """Uncached implementation of _scan_ids."""
+        scan = {"ids": [], "rids": [], "elements": 0, "error": None}
+        alternate_content_tag = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        rid_attr_name = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+        alternate_depth = 0
+
+        try:
+            for event, elem in lxml.etree.iterparse(
+                str(xml_file), events=("start", "end")
+            ):
+                tag = elem.tag
+                if event == "end":
+                    if tag == alternate_content_tag:
+                        alternate_depth -= 1
+                    # Drop the finished subtree and any processed siblings
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                    continue
+
+                scan["elements"] += 1
+                if tag == alternate_content_tag:
+                    alternate_depth += 1
+
+                rid_attr = elem.get(rid_attr_name)
+                if rid_attr:
+                    scan["rids"].append((tag.split("}")[-1], rid_attr, elem.sourceline))
+
+                rule = self._get_id_rule(tag)
+                if rule is None or alternate_depth:
+                    continue
+
+                # Look for the specified attribute
+                rule_tag, attr_name, scope = rule
+                for attr, value in elem.attrib.items():
+                    if attr.split("}")[-1].lower() == attr_name:
+                        scan["ids"].append(
+                            (rule_tag, attr_name, scope, value, elem.sourceline)
+                        )
+                        break
+        except Exception as e:
+            scan["error"] = e
+
+        return scan
+
+    @check
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
+        xml_files = self._changed_xml_files()
 
-        for xml_file in self.xml_files:
+        for xml_file in xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -143,6 +413,7 @@ class BaseSchemaValidator:
                     f"Unexpected error: {str(e)}"
                 )
 
+        self._record(errors, parts=len(xml_files))
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
@@ -153,13 +424,15 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    @check
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
+        xml_files = self._changed_xml_files()
 
-        for xml_file in self.xml_files:
+        for xml_file in xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -174,6 +447,8 @@ class BaseSchemaValidator:
             except lxml.etree.XMLSyntaxError:
                 continue
 
+        # Only root elements are read, so no element count is reported
+        self._record(errors, parts=len(xml_files))
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
             for error in errors:
@@ -183,87 +458,68 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    @check
     def validate_unique_ids(self):
-        """Validate that specific IDs are unique according to OOXML requirements."""
+        """Validate that specific IDs are unique according to OOXML requirements.
+
+        File-scoped IDs are only checked in changed parts. Globally scoped IDs
+        are collected from every part (using cached scans for unchanged ones),
+        and a clash is reported when either side is in a changed part.
+        """
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+            is_dirty = self._is_dirty(xml_file)
+            scan = self._scan_ids(xml_file)
+            self._record(parts=1, elements=scan["elements"])
+            if scan["error"] is not None:
+                if is_dirty:
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {scan['error']}"
                     )
+                continue
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # IDs inside mc:AlternateContent were already skipped by the scan
+            for tag, attr_name, scope, id_value, line in scan["ids"]:
+                if scope == "global":
+                    # Check global uniqueness
+                    if id_value in global_ids:
+                        prev_file, prev_line, prev_tag, prev_dirty = global_ids[
+                            id_value
+                        ]
+                        if is_dirty or prev_dirty:
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                                f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
                             )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                    else:
+                        global_ids[id_value] = (
+                            xml_file.relative_to(self.unpacked_dir),
+                            line,
+                            tag,
+                            is_dirty,
+                        )
+                elif scope == "file" and is_dirty:
+                    # Check file-level uniqueness
+                    key = (tag, attr_name)
+                    if key not in file_ids:
+                        file_ids[key] = {}
+
+                    if id_value in file_ids[key]:
+                        prev_line = file_ids[key][id_value]
+                        errors.append(
+                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"Line {line}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {prev_line})"
+                        )
+                    else:
+                        file_ids[key][id_value] = line
 
+        self._record(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
             for error in errors:
@@ -274,6 +530,7 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    @check
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -295,6 +552,8 @@ class BaseSchemaValidator:
                 file_path.is_file()
                 and file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
+                # Manifest written by `unpack.py --lazy`, not a package part
+                and file_path != self.unpacked_dir / LAZY_MANIFEST
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
 
@@ -309,8 +568,8 @@ class BaseSchemaValidator:
         # Check each .rels file
         for rels_file in rels_files:
             try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                # Read relationships file (indexed once per unchanged file)
+                relationships = self._read_relationships(rels_file)
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -319,11 +578,7 @@ class BaseSchemaValidator:
                 referenced_files = set()
                 broken_refs = []
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
+                for _, _, target, line in relationships:
                     if target and not target.startswith(
                         ("http", "mailto:")
                     ):  # Skip external URLs
@@ -344,9 +599,9 @@ class BaseSchemaValidator:
                                 referenced_files.add(target_path)
                                 all_referenced_files.add(target_path)
                             else:
-                                broken_refs.append((target, rel.sourceline))
+                                broken_refs.append((target, line))
                         except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
+                            broken_refs.append((target, line))
 
                 # Report broken references
                 if broken_refs:
@@ -368,6 +623,7 @@ class BaseSchemaValidator:
                 unref_rel_path = unref_file.relative_to(self.unpacked_dir)
                 errors.append(f"  Unreferenced file: {unref_rel_path}")
 
+        self._record(errors, parts=len(rels_files))
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
             for error in errors:
@@ -385,13 +641,12 @@ class BaseSchemaValidator:
                 )
             return True
 
+    @check
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -409,22 +664,21 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
+            # Skip pairs where neither the part nor its .rels file changed
+            if not (self._is_dirty(xml_file) or self._is_dirty(rels_file)):
+                continue
+
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                # Read the .rels file to get valid relationship IDs and their types
                 rid_to_type = {}
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
+                for rid, rel_type, _, line in self._read_relationships(rels_file):
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
                             rels_rel_path = rels_file.relative_to(self.unpacked_dir)
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
+                                f"  {rels_rel_path}: Line {line}: "
                                 f"Duplicate relationship ID '{rid}' (IDs must be unique)"
                             )
                         # Extract just the type name from the full URL
@@ -433,45 +687,39 @@ class BaseSchemaValidator:
                         )
                         rid_to_type[rid] = type_name
 
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
+                # Find all r:id references (collected by the streaming ID scan)
+                scan = self._scan_ids(xml_file)
+                self._record(parts=1, elements=scan["elements"])
+                if scan["error"] is not None:
+                    raise scan["error"]
 
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
+                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                for elem_name, rid_attr, line in scan["rids"]:
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_rel_path}: Line {line}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_rel_path}: Line {line}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
 
             except Exception as e:
                 xml_rel_path = xml_file.relative_to(self.unpacked_dir)
                 errors.append(f"  Error processing {xml_rel_path}: {e}")
 
+        self._record(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
             for error in errors:
@@ -519,6 +767,7 @@ class BaseSchemaValidator:
 
         return None
 
+    @check
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
         errors = []
@@ -526,30 +775,30 @@ class BaseSchemaValidator:
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
         if not content_types_file.exists():
+            self._record(["[Content_Types].xml file not found"])
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
             # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
+            overrides = root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override")
+            for override in overrides:
                 part_name = override.get("PartName")
                 if part_name is not None:
                     declared_parts.add(part_name.lstrip("/"))
 
             # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
+            defaults = root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default")
+            for default in defaults:
                 extension = default.get("Extension")
                 if extension is not None:
                     declared_extensions.add(extension.lower())
+            self._record(parts=1, elements=len(overrides) + len(defaults))
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -579,8 +828,13 @@ class BaseSchemaValidator:
             all_files = list(self.unpacked_dir.rglob("*"))
             all_files = [f for f in all_files if f.is_file()]
 
-            # Check all XML files for Override declarations
+            # Check all XML files for Override declarations (only changed parts,
+            # unless [Content_Types].xml itself changed)
+            content_types_dirty = self._is_dirty(content_types_file)
             for xml_file in self.xml_files:
+                if not (content_types_dirty or self._is_dirty(xml_file)):
+                    continue
+
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
                     "\\", "/"
                 )
@@ -593,7 +847,8 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    self._record(parts=1)
+                    root_tag = self._get_root_tag(xml_file)
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -614,6 +869,7 @@ class BaseSchemaValidator:
                 if "_rels" in file_path.parts or "docProps" in file_path.parts:
                     continue
 
+                self._record(parts=1)
                 extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
@@ -626,6 +882,7 @@ class BaseSchemaValidator:
         except Exception as e:
             errors.append(f"  Error parsing [Content_Types].xml: {e}")
 
+        self._record(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
             for error in errors:
@@ -673,7 +930,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -685,6 +942,7 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    @check
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
@@ -692,12 +950,18 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
+        xml_files = self._changed_xml_files()
+        if self.jobs > 1 and len(xml_files) > 1:
+            results = self._validate_files_against_xsd_parallel(xml_files)
+        else:
+            results = (
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
             )
 
+        for xml_file, (is_valid, new_file_errors) in zip(xml_files, results):
+            relative_path = str(xml_file.relative_to(self.unpacked_dir))
+
             if is_valid is None:
                 skipped_count += 1
                 continue
@@ -712,14 +976,16 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
+        self._record(new_errors, parts=len(xml_files))
+
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -738,6 +1004,32 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd_parallel(self, xml_files):
+        """Validate XML files across a process pool.
+
+        Each worker builds its own validator, and therefore its own compiled
+        schema cache, from a copy of this validator's baseline (including any
+        preserved parts) and dirty parts. Results are returned in the order of
+        xml_files regardless of which worker finished first.
+
+        Returns:
+            list: (is_valid, new_errors_set) tuples, one per XML file
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(xml_files)),
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                self.unpacked_dir,
+                self.original_file,
+                self.baseline,
+                self.dirty_parts,
+            ),
+        ) as executor:
+            return list(executor.map(_validate_file_in_worker, xml_files))
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -823,24 +1115,25 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, load_tree=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        If load_tree is given, it is called to obtain the parsed document instead
+        of reading xml_file, which is then only used to pick the schema.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process)
+            schema = _load_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            if load_tree is not None:
+                xml_doc = load_tree()
+            else:
+                xml_doc = self._parse_xml(xml_file)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -869,39 +1162,34 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is read from the baseline package and its errors are memoized
+        there, so each original part is validated at most once per run.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        part_name = xml_file.relative_to(unpacked_dir).as_posix()
 
-            if not original_xml_file.exists():
+        if part_name not in self.baseline.xsd_errors:
+            if not self.baseline.has_part(part_name):
                 # File didn't exist in original, so no original errors
-                return set()
+                errors = set()
+            else:
+                # Validate the specific file in original
+                is_valid, errors = self._validate_single_file_xsd(
+                    xml_file,
+                    unpacked_dir,
+                    load_tree=lambda: self.baseline.parse(part_name),
+                )
+            self.baseline.xsd_errors[part_name] = errors if errors else set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        return self.baseline.xsd_errors[part_name]
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
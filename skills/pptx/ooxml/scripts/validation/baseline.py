@@ -0,0 +1,131 @@
+"""
+Read-only access to the original Office file used as a validation baseline.
+"""
+
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+class BaselinePackage:
+    """Original Office file that validators compare the unpacked document against.
+
+    Parts are read lazily and straight from the zip archive into memory, so the
+    original is never extracted to disk. One instance can be shared by several
+    validators; parsed parts and per-part XSD errors are memoized on it, so the
+    cost of the baseline is paid once per validation run.
+
+    The original may also be an unpacked directory, whose files are then read
+    in place without packing it. Call preserve() before overwriting files in
+    that directory so the baseline keeps their original content.
+
+    Attributes:
+        original_file: Path to the original .docx/.pptx/.xlsx file or directory
+        xsd_errors: Memoized XSD error sets, keyed by part name
+    """
+
+    def __init__(self, original_file):
+        """
+        Initialize with path to the original Office file.
+
+        Args:
+            original_file: Path to original file (str or Path)
+        """
+        self.original_file = Path(original_file)
+        self.xsd_errors = {}
+        self._zip = None
+        self._names = None
+        self._trees = {}
+        # Original bytes of directory parts saved by preserve()
+        self._preserved = {}
+
+    def __getstate__(self):
+        """Pickle the baseline for worker processes.
+
+        Preserved parts and memoized XSD errors travel with it; the archive
+        handle and parsed trees are reopened lazily on the other side.
+        """
+        state = self.__dict__.copy()
+        state.update(_zip=None, _names=None, _trees={})
+        return state
+
+    def _open(self):
+        """Open the archive on first use and index its member names."""
+        if self._names is None:
+            if self.original_file.is_dir():
+                self._names = {
+                    path.relative_to(self.original_file).as_posix()
+                    for path in self.original_file.rglob("*")
+                    if path.is_file()
+                }
+            else:
+                self._zip = zipfile.ZipFile(self.original_file, "r")
+                self._names = set(self._zip.namelist())
+        return self._zip
+
+    def has_part(self, part_name):
+        """Return True if the original contains the part (e.g. "word/document.xml")."""
+        self._open()
+        return part_name in self._names
+
+    def read(self, part_name):
+        """
+        Read the raw bytes of a part.
+
+        Raises:
+            KeyError: If the original does not contain the part
+        """
+        archive = self._open()
+        if archive is not None:
+            return archive.read(part_name)
+        if part_name in self._preserved:
+            return self._preserved[part_name]
+        if part_name not in self._names:
+            raise KeyError(f"There is no item named {part_name!r} in the original")
+        return (self.original_file / part_name).read_bytes()
+
+    def preserve(self, part_names):
+        """
+        Keep the current content of directory parts that are about to change.
+
+        Only needed when the original is a directory that will be written to;
+        parts of an archive never change. Parts that are not in the original
+        (new files) are ignored.
+
+        Args:
+            part_names: Part names (e.g. "word/document.xml") about to be overwritten
+        """
+        if self._open() is not None:
+            return
+        for part_name in part_names:
+            if part_name in self._names and part_name not in self._preserved:
+                self._preserved[part_name] = self.read(part_name)
+
+    def parse(self, part_name):
+        """
+        Parse a part with lxml, caching the tree for later callers.
+
+        The returned tree is shared and must not be modified.
+
+        Raises:
+            KeyError: If the original does not contain the part
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        if part_name not in self._trees:
+            self._trees[part_name] = lxml.etree.ElementTree(
+                lxml.etree.fromstring(self.read(part_name))
+            )
+        return self._trees[part_name]
+
+    def close(self):
+        """Close the underlying archive and drop cached parts."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+            self._names = None
+        self._trees.clear()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
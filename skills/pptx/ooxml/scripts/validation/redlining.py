@@ -2,117 +2,263 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import hashlib
 from pathlib import Path
 
+import lxml.etree
 
-class RedliningValidator:
+from .baseline import BaselinePackage
+from .results import CheckRecorder, check
+from .word_diff import word_diff
+
+# Clark-notation names read while scanning document.xml
+W_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = f"{W_NAMESPACE}p"
+W_T = f"{W_NAMESPACE}t"
+W_DEL = f"{W_NAMESPACE}del"
+W_INS = f"{W_NAMESPACE}ins"
+W_DEL_TEXT = f"{W_NAMESPACE}delText"
+W_AUTHOR = f"{W_NAMESPACE}author"
+
+# Only these elements affect the compared text, so no other events are raised
+SCANNED_TAGS = (W_P, W_T, W_DEL_TEXT, W_INS, W_DEL)
+
+# Author whose tracked changes are removed before comparing the texts
+TRACKED_AUTHOR = "Claude"
+
+
+class RedliningValidator(CheckRecorder):
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_docx,
+        verbose=False,
+        baseline=None,
+        dirty_parts=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        # Original package, optionally shared with other validators in this run
+        self.baseline = baseline or BaselinePackage(self.original_docx)
+        # Parts changed since the original; None means assume everything changed
+        self.dirty_parts = (
+            {Path(part).as_posix() for part in dirty_parts}
+            if dirty_parts is not None
+            else None
+        )
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        # CheckResult for every check run, in order (see results.py)
+        self.results = []
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
+        return self.validate_tracked_changes()
+
+    @check
+    def validate_tracked_changes(self):
+        """Validate that all text changes by Claude are wrapped in tracked changes."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
+            self._record([f"Modified document.xml not found at {modified_file}"])
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
-        try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        # An unchanged document.xml is identical to the original
+        if self.dirty_parts is not None and "word/document.xml" not in self.dirty_parts:
+            if self.verbose:
+                print("PASSED - document.xml unchanged, no tracked changes to check.")
+            return True
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
+        # Stream the modified document once, hashing each paragraph's text as
+        # it would read with Claude's tracked changes removed
+        try:
+            modified = self._scan_paragraphs(self._stream_events(modified_file))
+        except lxml.etree.XMLSyntaxError as e:
+            self._record([f"Error parsing XML files: {e}"])
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        self._record(parts=1, elements=modified["elements"])
 
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not modified["tracked"]:
+            if self.verbose:
+                print("PASSED - No tracked changes by Claude found.")
+            return True
 
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
+        # Read original document.xml straight from the original docx
+        try:
+            has_original = self.baseline.has_part("word/document.xml")
+        except Exception as e:
+            self._record([f"Error unpacking original docx: {e}"])
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
 
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
+        if not has_original:
+            self._record([f"Original document.xml not found in {self.original_docx}"])
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
 
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        try:
+            original = self._scan_paragraphs(self._original_events())
+        except lxml.etree.XMLSyntaxError as e:
+            self._record([f"Error parsing XML files: {e}"])
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        self._record(parts=1, elements=original["elements"])
+
+        # Same paragraph digests: the texts match without ever being joined
+        if original["digests"] != modified["digests"]:
+            # Only paragraphs between the common leading and trailing runs
+            # are extracted and diffed
+            start, original_end, modified_end, trailing = _differing_window(
+                original["digests"], modified["digests"]
+            )
+            original_text = self._window_text(
+                self._original_events(), start, original_end, trailing
+            )
+            modified_text = self._window_text(
+                self._stream_events(modified_file), start, modified_end, trailing
+            )
 
             if modified_text != original_text:
                 # Show detailed character-level differences for each paragraph
                 error_message = self._generate_detailed_diff(
                     original_text, modified_text
                 )
+                self._record([error_message])
                 print(error_message)
                 return False
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _stream_events(self, xml_file):
+        """Parse events for a document.xml on disk, streamed with iterparse."""
+        return lxml.etree.iterparse(
+            str(xml_file),
+            events=("start", "end"),
+            tag=SCANNED_TAGS,
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+        )
+
+    def _original_events(self):
+        """Walk events for the original document.xml, parsed once per baseline."""
+        root = self.baseline.parse("word/document.xml").getroot()
+        return lxml.etree.iterwalk(root, events=("start", "end"), tag=SCANNED_TAGS)
+
+    def _scan_paragraphs(self, events, keep=None):
+        """Read paragraph texts as they would be with Claude's changes removed.
+
+        Text inside Claude's w:ins is dropped and w:delText inside Claude's
+        w:del counts as text, without modifying the tree. Paragraphs are
+        numbered in document order (by start tag) and empty ones are skipped,
+        as in the full text comparison: a paragraph's text includes that of
+        paragraphs nested in it (e.g. in text boxes). When events come from
+        iterparse, finished paragraphs are cleared to keep memory flat.
+
+        Args:
+            events: (event, element) pairs with "start" and "end" events for
+                the elements in SCANNED_TAGS
+            keep: Optional range of paragraph numbers whose text is returned
+
+        Returns:
+            dict: "digests" -> digest of each non-empty paragraph, in order,
+                  "texts" -> {paragraph number: text} for numbers in keep,
+                  "elements" -> number of scanned elements,
+                  "tracked" -> True if Claude authored any w:ins or w:del
+        """
+        streaming = isinstance(events, lxml.etree.iterparse)
+        digests = []
+        texts = {}
+        elements = 0
+        tracked = False
+        ins_depth = 0
+        del_depth = 0
+        # Text parts of each open paragraph; finished texts wait in pending
+        # until the outermost paragraph ends, to keep document order
+        open_paragraphs = []
+        pending = []
+
+        for event, elem in events:
+            tag = elem.tag
+            if event == "start":
+                elements += 1
+                if tag == W_INS or tag == W_DEL:
+                    if elem.get(W_AUTHOR) == TRACKED_AUTHOR:
+                        tracked = True
+                        if tag == W_INS:
+                            ins_depth += 1
+                        else:
+                            del_depth += 1
+                elif tag == W_P and not ins_depth:
+                    # Paragraphs inside Claude's insertions are removed entirely
+                    open_paragraphs.append((len(pending), []))
+                    pending.append(None)
+                continue
+
+            if tag == W_T or tag == W_DEL_TEXT:
+                text = elem.text
+                if text and not ins_depth and (tag == W_T or del_depth):
+                    for _, parts in open_paragraphs:
+                        parts.append(text)
+            elif tag == W_P and not ins_depth:
+                slot, parts = open_paragraphs.pop()
+                pending[slot] = "".join(parts)
+                if open_paragraphs:
+                    continue
+                for text in pending:
+                    # Skip empty paragraphs - they don't affect content validation
+                    if text:
+                        if keep is not None and len(digests) in keep:
+                            texts[len(digests)] = text
+                        digests.append(_paragraph_digest(text))
+                pending.clear()
+                # Nothing after the requested paragraphs is needed
+                if keep is not None and len(digests) >= keep.stop:
+                    break
+                if streaming:
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            elif tag == W_INS or tag == W_DEL:
+                if elem.get(W_AUTHOR) == TRACKED_AUTHOR:
+                    if tag == W_INS:
+                        ins_depth -= 1
+                    else:
+                        del_depth -= 1
+
+        return {
+            "digests": digests,
+            "texts": texts,
+            "elements": elements,
+            "tracked": tracked,
+        }
+
+    def _window_text(self, events, start, end, trailing):
+        """Join the texts of paragraphs start..end-1 as in the full document text.
+
+        Args:
+            events: Parse events for the document (see _scan_paragraphs)
+            start: Number of the first paragraph in the window
+            end: Number one past the last paragraph in the window
+            trailing: True if paragraphs follow the window, so its last line
+                ends with a newline as it does in the full text
+        """
+        texts = self._scan_paragraphs(events, keep=range(start, end))["texts"]
+        text = "\n".join(texts[number] for number in range(start, end))
+        return text + "\n" if trailing else text
 
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences using a word diff."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +273,75 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        diff = self._get_word_diff(original_text, modified_text)
+        if diff:
+            error_parts.extend(["Differences:", "============", diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff with character-level precision.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        The diff is computed in-process (see word_diff.py) and matches what
+        `git diff --word-diff=plain -U0` prints, without the hunk headers.
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        # Try character-level diff first for precise differences
+        content_lines = self._diff_content_lines(
+            word_diff(original_text, modified_text, word_regex=".")
+        )
+        if content_lines:
+            return "\n".join(content_lines)
+
+        # Fallback to word-level diff if character-level is too verbose
+        content_lines = self._diff_content_lines(
+            word_diff(original_text, modified_text)
+        )
+        return "\n".join(content_lines) or None
+
+    def _diff_content_lines(self, diff_text):
+        """Return the non-blank lines of a word diff, skipping hunk headers."""
+        return [
+            line
+            for line in diff_text.split("\n")
+            if not line.startswith("@@") and line.strip()
+        ]
+
+
+def _paragraph_digest(text):
+    """Digest of one paragraph's text, compared instead of the text itself."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _differing_window(original, modified):
+    """Find the paragraphs that differ, trimming common leading/trailing runs.
+
+    When nothing follows the window, one more common paragraph is kept in
+    front of it: the last line of the full text has no newline, so the word
+    diff must see the line before it to report the change the same way.
+
+    Args:
+        original: Paragraph digests of the original document
+        modified: Paragraph digests of the modified document
+
+    Returns:
+        tuple: (start, original_end, modified_end, trailing), where trailing is
+            True if common paragraphs follow the window
+    """
+    limit = min(len(original), len(modified))
+    start = 0
+    while start < limit and original[start] == modified[start]:
+        start += 1
+    suffix = 0
+    while suffix < limit - start and original[-1 - suffix] == modified[-1 - suffix]:
+        suffix += 1
+    if not suffix and start:
+        start -= 1
+    return start, len(original) - suffix, len(modified) - suffix, bool(suffix)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+"""
+Structured results recorded by the validators alongside their console output.
+"""
+
+import functools
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CheckResult:
+    """Outcome of a single validation check.
+
+    Attributes:
+        name: Name of the check method (e.g. "validate_unique_ids")
+        passed: Whether the check passed
+        errors: Error messages reported by the check
+        seconds: Wall-clock time spent in the check
+        parts_visited: Number of package parts the check examined
+        elements_visited: Number of XML elements the check examined (not
+            counted for root elements read only to identify a part)
+    """
+
+    name: str
+    passed: bool = True
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    parts_visited: int = 0
+    elements_visited: int = 0
+
+    def to_dict(self):
+        """Return the result as a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 6),
+            "parts_visited": self.parts_visited,
+            "elements_visited": self.elements_visited,
+        }
+
+
+def check(method):
+    """Record a CheckResult for each call of a validator check method.
+
+    The wrapped method keeps returning its bool. Its wall-clock time and pass
+    state are captured automatically; the method reports its errors and visit
+    counts through CheckRecorder._record().
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = CheckResult(method.__name__)
+        outer = self._current_check
+        self._current_check = result
+        start = time.perf_counter()
+        try:
+            passed = method(self, *args, **kwargs)
+        finally:
+            result.seconds = time.perf_counter() - start
+            self._current_check = outer
+        result.passed = bool(passed)
+        self.results.append(result)
+        return passed
+
+    return wrapper
+
+
+class CheckRecorder:
+    """Mixin giving a validator a list of CheckResult objects.
+
+    Validators set self.results to an empty list in __init__ and decorate
+    their checks with @check.
+
+    Attributes:
+        results: CheckResult for every check run so far, in order
+    """
+
+    _current_check = None
+
+    def _record(self, errors=(), parts=0, elements=0):
+        """Attach errors and visit counts to the check currently running."""
+        result = self._current_check
+        if result is None:
+            return
+        result.errors.extend(error.strip() for error in errors)
+        result.parts_visited += parts
+        result.elements_visited += elements
+
+    def report(self):
+        """Return all results of this validator as a JSON-serializable dict."""
+        return {
+            "validator": type(self).__name__,
+            "passed": all(result.passed for result in self.results),
+            "seconds": round(sum(result.seconds for result in self.results), 6),
+            "checks": [result.to_dict() for result in self.results],
+        }
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
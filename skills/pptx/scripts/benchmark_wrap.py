@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark the line wrapping used by inventory.py for overflow estimation.
+
+Wraps the same text-dense lines (disclaimer-style paragraphs and short table
+cells) with ShapeData._wrap_text_line and with the word-by-word reference
+implementation it replaced, then reports the time taken by each and any
+lines that wrap differently.
+
+Usage:
+    python benchmark_wrap.py [--font FONT_FILE] [--lines N] [--seed N]
+
+Examples:
+    python benchmark_wrap.py
+    # Uses PIL's default font
+
+    python benchmark_wrap.py --font /usr/share/fonts/truetype/dejavu/DejaVuSans.ttf
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, List
+
+from inventory import ShapeData, load_font_file
+from PIL import Image, ImageDraw
+
+# Vocabulary for the generated lines
+WORDS = (
+    "the company shall not be liable for any indirect incidental special "
+    "consequential or punitive damages including without limitation loss of "
+    "profits data use goodwill or other intangible losses resulting from "
+    "access to or inability to access the services notwithstanding "
+    "indemnification 2024 Q3 $1,250.00 n/a"
+).split()
+
+# Font sizes (points) and usable frame widths (pixels) sampled per line
+FONT_SIZES = (8, 10, 12, 14, 18, 24)
+WIDTHS_PX = (60, 120, 240, 480, 900)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark inventory.py line wrapping against the word-by-word reference.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--font", help="Font file to measure with (default: PIL's)")
+    parser.add_argument(
+        "--lines", type=int, default=2000, help="Number of lines to wrap"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    cases = generate_cases(args.lines, random.Random(args.seed))
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    fonts = {size: load_font_file(args.font, size) for size in FONT_SIZES}
+    shape_data = ShapeData.__new__(ShapeData)
+
+    start = time.perf_counter()
+    expected = [
+        wrap_text_line_reference(line, width, draw, fonts[size])
+        for line, width, size in cases
+    ]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [
+        shape_data._wrap_text_line(line, width, draw, fonts[size])
+        for line, width, size in cases
+    ]
+    wrap_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    wrapped_lines = sum(len(lines) for lines in expected)
+    print(f"Lines: {len(cases)} ({wrapped_lines} after wrapping)")
+    print(f"Reference: {reference_time:.3f}s")
+    print(f"Current:   {wrap_time:.3f}s ({reference_time / wrap_time:.1f}x)")
+    print(f"Lines wrapped differently: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+def generate_cases(count: int, rng: random.Random) -> List[tuple]:
+    """Generate (line, max_width_px, font_size) cases, mostly long paragraphs."""
+    cases = []
+    for _ in range(count):
+        word_count = rng.choice((3, 8, 40, 120, 400))
+        words = [rng.choice(WORDS) for _ in range(word_count)]
+        # Occasional repeated spaces produce empty words
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words) + 1), "")
+        cases.append((" ".join(words), rng.choice(WIDTHS_PX), rng.choice(FONT_SIZES)))
+    return cases
+
+
+def wrap_text_line_reference(
+    line: str, max_width_px: int, draw: Any, font: Any
+) -> List[str]:
+    """Word-by-word wrapping that measures every candidate line in full."""
+    if not line:
+        return [""]
+
+    if draw.textlength(line, font=font) <= max_width_px:
+        return [line]
+
+    wrapped = []
+    words = line.split(" ")
+    current_line = ""
+
+    for word in words:
+        test_line = current_line + (" " if current_line else "") + word
+        if draw.textlength(test_line, font=font) <= max_width_px:
+            current_line = test_line
+        else:
+            if current_line:
+                wrapped.append(current_line)
+            current_line = word
+
+    if current_line:
+        wrapped.append(current_line)
+
+    return wrapped
+
+
+if __name__ == "__main__":
+    main()
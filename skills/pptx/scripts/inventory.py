@@ -19,13 +19,19 @@ Main Functions:
     save_inventory: Save extracted data to JSON
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--issues-only] [--jobs N]
+        [--backend {pptx,xml}]
 """
 
 import argparse
+import bisect
+import functools
 import json
+import os
 import platform
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -35,6 +41,11 @@ from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
 
+try:
+    import numpy as np
+except ImportError:  # Overlaps are then found with the pure-Python sweep
+    np = None
+
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
 ParagraphDict = Dict[str, JsonValue]
@@ -46,6 +57,19 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Number of loaded fonts kept by load_font_file, keyed by (path, size)
+FONT_CACHE_SIZE = 64
+
+# Number of measured word widths kept by word_width, keyed by (font, word)
+WORD_WIDTH_CACHE_SIZE = 65536
+
+# Allowance (pixels) for kerning between a word and the space after it when
+# line widths are estimated from word widths; closer calls are measured
+KERNING_SLACK_PX = 0.25
+
+# Slides with at least this many shapes find overlap candidates with NumPy
+VECTORIZE_MIN_SHAPES = 64
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +84,13 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Processes slides in 4 worker processes (same output, in slide order)
+
+  python inventory.py presentation.pptx inventory.json --backend xml
+    Reads the slide XML directly instead of loading the presentation with
+    python-pptx (same output, read-only, faster on large decks)
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +107,25 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to spread slides over (default: 1)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("pptx", "xml"),
+        default="pptx",
+        help="Read slides with python-pptx or directly from the slide XML "
+        "(default: pptx)",
+    )
+    parser.add_argument(
+        "--font-cache",
+        metavar="PATH",
+        help="JSON file caching the font directory listings between runs",
+    )
 
     args = parser.parse_args()
 
@@ -88,13 +138,29 @@ The output JSON includes:
         print("Error: Input must be a PowerPoint file (.pptx)")
         sys.exit(1)
 
+    if args.backend == "xml" and args.jobs > 1:
+        parser.error("--jobs is only supported with --backend pptx")
+
+    if args.font_cache:
+        ShapeData.font_catalog = FontCatalog(cache_path=Path(args.font_cache))
+
     try:
         print(f"Extracting text inventory from: {args.input}")
         if args.issues_only:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        if args.backend == "xml":
+            # Imported here: inventory_xml builds on the classes in this module
+            from inventory_xml import extract_text_inventory_xml
+
+            inventory = extract_text_inventory_xml(
+                input_path, issues_only=args.issues_only
+            )
+        else:
+            inventory = extract_text_inventory(
+                input_path, issues_only=args.issues_only, jobs=args.jobs
+            )
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -263,30 +329,72 @@ class ParagraphData:
         return result
 
 
-class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+class FontCatalog:
+    """Index of the font files in the platform font directories.
 
-    @staticmethod
-    def emu_to_inches(emu: int) -> float:
-        """Convert EMUs (English Metric Units) to inches."""
-        return emu / 914400.0
+    Each directory is listed once, on the first lookup, instead of probing it
+    for every name variant and extension. Listings can be kept in a JSON
+    file between runs; they are reused while the modification times of all
+    font directories are unchanged. Lookups are memoized by font name.
 
-    @staticmethod
-    def inches_to_pixels(inches: float, dpi: int = 96) -> int:
-        """Convert inches to pixels at given DPI."""
-        return int(inches * dpi)
+    Attributes:
+        font_dirs: Directories searched, in order
+        extensions: Font file extensions searched, in order
+        cache_path: Optional JSON file caching the directory listings
+    """
 
-    @staticmethod
-    def get_font_path(font_name: str) -> Optional[str]:
+    CACHE_VERSION = 2
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Initialize for the current platform.
+
+        Args:
+            cache_path: Optional JSON file to read and write directory listings
+        """
+        if platform.system() == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            self.extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+            # The default macOS file system matches file names case-insensitively
+            self._case_sensitive = False
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            self.extensions = [".ttf", ".otf"]
+            self._case_sensitive = True
+
+        self.font_dirs = [Path(font_dir).expanduser() for font_dir in font_dirs]
+        self.cache_path = cache_path
+        # Directory -> [(entry name, is regular file)], in listing order, or
+        # None if the directory cannot be listed; missing directories are left out
+        self._listings: Optional[Dict[str, Optional[List[Tuple[str, bool]]]]] = None
+        self._found: Dict[str, Optional[str]] = {}
+
+    def find(self, font_name: str) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Exact file names are tried first for each directory, then any font
+        file whose name contains the font name.
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
+        if font_name not in self._found:
+            self._found[font_name] = self._lookup(font_name)
+        return self._found[font_name]
+
+    def _lookup(self, font_name: str) -> Optional[str]:
+        """Uncached implementation of find."""
+        listings = self._get_listings()
 
         # Common font file variations to try
         font_variations = [
@@ -295,52 +403,176 @@ class ShapeData:
             font_name.replace(" ", ""),
             font_name.replace(" ", "-"),
         ]
+        font_name_lower = font_name.lower().replace(" ", "")
 
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
+        for font_dir_path in self.font_dirs:
+            if str(font_dir_path) not in listings:
+                continue
+            entries = listings[str(font_dir_path)]
+
+            if entries is None:
+                # The directory cannot be listed, but its files may still be
+                # reachable by name
+                for variant in font_variations:
+                    for ext in self.extensions:
+                        font_path = font_dir_path / f"{variant}{ext}"
+                        if font_path.exists():
+                            return str(font_path)
                 continue
 
             # First try exact matches
+            names = {self._name_key(name) for name, _ in entries}
             for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
+                for ext in self.extensions:
+                    if self._name_key(f"{variant}{ext}") in names:
+                        return str(font_dir_path / f"{variant}{ext}")
 
             # Then try fuzzy matching - find files containing the font name
+            for name, is_file in entries:
+                file_name_lower = name.lower()
+                if (
+                    is_file
+                    and font_name_lower in file_name_lower
+                    and any(file_name_lower.endswith(ext) for ext in self.extensions)
+                ):
+                    return str(font_dir_path / name)
+
+        return None
+
+    def _name_key(self, name: str) -> str:
+        """Key under which the file system matches a file name."""
+        return name if self._case_sensitive else name.lower()
+
+    def _get_listings(self) -> Dict[str, Optional[List[Tuple[str, bool]]]]:
+        """List the font directories, from the cache file when it is current."""
+        if self._listings is not None:
+            return self._listings
+
+        mtimes = {}
+        for font_dir_path in self.font_dirs:
             try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
+                if font_dir_path.is_dir():
+                    mtimes[str(font_dir_path)] = font_dir_path.stat().st_mtime_ns
+            except OSError:
                 continue
 
-        return None
+        self._listings = self._read_cache(mtimes)
+        if self._listings is None:
+            self._listings = {}
+            for font_dir in mtimes:
+                try:
+                    self._listings[font_dir] = [
+                        (entry.name, entry.is_file()) for entry in os.scandir(font_dir)
+                    ]
+                except OSError:
+                    # Unreadable directories still get exact-name lookups
+                    self._listings[font_dir] = None
+            self._write_cache(mtimes)
+        return self._listings
+
+    def _read_cache(
+        self, mtimes: Dict[str, int]
+    ) -> Optional[Dict[str, Optional[List[Tuple[str, bool]]]]]:
+        """Load listings from the cache file if it matches the directory mtimes."""
+        if self.cache_path is None:
+            return None
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if (
+                cached.get("version") != self.CACHE_VERSION
+                or cached["mtimes"] != mtimes
+            ):
+                return None
+            return {
+                font_dir: None
+                if entries is None
+                else [(name, is_file) for name, is_file in entries]
+                for font_dir, entries in cached["listings"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, mtimes: Dict[str, int]) -> None:
+        """Save the listings to the cache file, ignoring write failures."""
+        if self.cache_path is None or self._listings is None:
+            return
+        cached = {
+            "version": self.CACHE_VERSION,
+            "mtimes": mtimes,
+            "listings": self._listings,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_path.parent, prefix=f".{self.cache_path.name}."
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cached, f)
+                os.replace(temp_path, self.cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font_file(font_path: Optional[str], size: int) -> Any:
+    """Load a font for text measurement, keeping recently used fonts loaded.
+
+    Args:
+        font_path: Path to a TrueType/OpenType font file, or None
+        size: Font size in pixels
+
+    Returns:
+        FreeTypeFont, or PIL's default font if the file cannot be loaded
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=WORD_WIDTH_CACHE_SIZE)
+def word_width(font: Any, word: str) -> float:
+    """Advance width of a word in pixels, cached across lines and shapes."""
+    return font.getlength(word)
+
+
+class ShapeData:
+    """Data structure for shape properties extracted from a PowerPoint shape."""
+
+    # Font files used for overflow estimation, shared by all shapes
+    font_catalog = FontCatalog()
+
+    # Class that reads the formatting of a text frame paragraph
+    paragraph_class: type = ParagraphData
+
+    @staticmethod
+    def emu_to_inches(emu: int) -> float:
+        """Convert EMUs (English Metric Units) to inches."""
+        return emu / 914400.0
+
+    @staticmethod
+    def inches_to_pixels(inches: float, dpi: int = 96) -> int:
+        """Convert inches to pixels at given DPI."""
+        return int(inches * dpi)
+
+    @classmethod
+    def get_font_path(cls, font_name: str) -> Optional[str]:
+        """Get the font file path for a given font name.
+
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri')
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        return cls.font_catalog.find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -461,20 +693,35 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
+        # Paragraphs kept when pickled without the shape (see __getstate__)
+        self._paragraphs: Optional[List[ParagraphData]] = None
         self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the python-pptx shape, keeping its paragraphs.
+
+        Used to return shapes from worker processes; the unpickled ShapeData
+        has shape set to None.
+        """
+        state = self.__dict__.copy()
+        state["_paragraphs"] = self.paragraphs
+        state["shape"] = None
+        return state
+
     @property
     def paragraphs(self) -> List[ParagraphData]:
         """Calculate paragraphs from the shape's text frame."""
+        if self._paragraphs is not None:
+            return self._paragraphs
         if not self.shape or not hasattr(self.shape, "text_frame"):
             return []
 
         paragraphs = []
         for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
             if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
+                paragraphs.append(self.paragraph_class(paragraph))
         return paragraphs
 
     def _get_default_font_size(self) -> int:
@@ -488,14 +735,21 @@ class ShapeData:
             slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
             if not hasattr(slide_master, "element"):
                 return 14
+        except Exception:
+            return 14
+
+        return self._text_style_font_size(slide_master.element)
 
+    def _text_style_font_size(self, master_element: Any) -> int:
+        """Get the font size of the master's title or body text style."""
+        try:
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
             if self.placeholder_type and "TITLE" in self.placeholder_type:
                 style_name = "titleStyle"
 
             # Find font size in theme styles
-            for child in slide_master.element.iter():
+            for child in master_element.iter():
                 tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
                 if tag == style_name:
                     for elem in child.iter():
@@ -532,30 +786,60 @@ class ShapeData:
         )
 
     def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
+        """Wrap a single line of text to fit within max_width_px.
+
+        Lines break greedily between words. Line widths are estimated from
+        cached word widths (prefix sums, words joined by one space width) and
+        each break is found with a binary search. Only lines whose estimate is
+        within the kerning slack of max_width_px are measured with PIL.
+        """
         if not line:
             return [""]
 
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
+        words = line.split(" ")
+        space_width = word_width(font, " ")
+        # ends[k]: estimated width of words[:k], each followed by a space
+        ends = [0.0]
+        for word in words:
+            ends.append(ends[-1] + word_width(font, word) + space_width)
+
+        def fits(start: int, stop: int) -> bool:
+            """Whether words[start:stop], joined by spaces, fit on one line."""
+            estimate = ends[stop] - ends[start] - space_width
+            slack = 2 * (stop - start - 1) * KERNING_SLACK_PX
+            if estimate <= max_width_px - slack:
+                return True
+            if estimate > max_width_px + slack:
+                return False
+            text = " ".join(words[start:stop])
+            return draw.textlength(text, font=font) <= max_width_px
+
+        if fits(0, len(words)):
             return [line]
 
-        # Need to wrap - split into words
+        # Need to wrap
         wrapped = []
-        words = line.split(" ")
-        current_line = ""
+        start = 0
+        while start < len(words):
+            # Empty words (repeated spaces) are dropped at the start of a line
+            if not words[start]:
+                start += 1
+                continue
 
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
+            # Estimated end of the line: the first word that would not fit
+            stop = bisect.bisect_right(
+                ends, ends[start] + max_width_px + space_width, lo=start + 1
+            )
+            stop = min(max(stop - 1, start + 1), len(words))
+
+            # Correct the estimate where kerning could move the break
+            while stop < len(words) and fits(start, stop + 1):
+                stop += 1
+            while stop > start + 1 and not fits(start, stop):
+                stop -= 1
 
-        if current_line:
-            wrapped.append(current_line)
+            wrapped.append(" ".join(words[start:stop]))
+            start = stop
 
         return wrapped
 
@@ -587,21 +871,13 @@ class ShapeData:
             if not paragraph.text.strip():
                 continue
 
-            para_data = ParagraphData(paragraph)
+            para_data = self.paragraph_class(paragraph)
 
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = load_font_file(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
@@ -885,34 +1161,97 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Candidate pairs come from a sweep over the shapes sorted by left edge,
+    so only shapes that overlap horizontally are compared; each candidate is
+    then checked with calculate_overlap. Entries are added in the same order
+    as comparing every pair would add them.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+    if np is not None and len(shapes) >= VECTORIZE_MIN_SHAPES:
+        pairs = _overlap_candidates_vectorized(rects)
+    else:
+        pairs = _overlap_candidates(rects)
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    for i, j in sorted(pairs):
+        overlaps, overlap_area = calculate_overlap(rects[i], rects[j])
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+            shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+def _overlap_candidates(
+    rects: List[Tuple[float, float, float, float]],
+) -> List[Tuple[int, int]]:
+    """Find index pairs (i < j) of rectangles whose spans overlap on both axes.
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    Every pair that calculate_overlap reports as overlapping is included:
+    overlapping by more than the tolerance implies the open spans intersect.
+    """
+    order = sorted(range(len(rects)), key=lambda i: rects[i][0])
+    lefts = [rects[i][0] for i in order]
+    pairs = []
+
+    for pos, i in enumerate(order):
+        left1, top1, w1, h1 = rects[i]
+        # Shapes further along start no further left; stop at the right edge
+        end = bisect.bisect_left(lefts, left1 + w1, lo=pos + 1)
+        for j in order[pos + 1 : end]:
+            _, top2, _, h2 = rects[j]
+            if top2 < top1 + h1 and top1 < top2 + h2:
+                pairs.append((min(i, j), max(i, j)))
+
+    return pairs
+
+
+def _overlap_candidates_vectorized(
+    rects: List[Tuple[float, float, float, float]],
+) -> List[Tuple[int, int]]:
+    """NumPy version of _overlap_candidates.
+
+    The sweep is done with searchsorted over the sorted left edges, and the
+    overlap extents of calculate_overlap are computed for all candidates at
+    once with the same floating point operations.
+    """
+    boxes = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    order = np.argsort(boxes[:, 0], kind="stable")
+    left, top, width, height = boxes[order].T
+    right = left + width
+    bottom = top + height
+
+    # Candidates of sorted position p are positions p+1 .. end[p]-1
+    end = np.searchsorted(left, right, side="left")
+    counts = np.maximum(end - np.arange(len(left)) - 1, 0)
+    first = np.repeat(np.arange(len(left)), counts)
+    offsets = np.cumsum(counts) - counts
+    second = first + 1 + np.arange(len(first)) - np.repeat(offsets, counts)
+
+    overlap_width = np.minimum(right[first], right[second]) - np.maximum(
+        left[first], left[second]
+    )
+    overlap_height = np.minimum(bottom[first], bottom[second]) - np.maximum(
+        top[first], top[second]
+    )
+    hits = (overlap_width > 0) & (overlap_height > 0)
+
+    i = order[first[hits]]
+    j = order[second[hits]]
+    return list(zip(np.minimum(i, j).tolist(), np.maximum(i, j).tolist()))
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,56 +1259,143 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes. With more than one, slides are
+            spread over processes that each load pptx_path; the returned
+            ShapeData objects then have no shape attached. Cannot be
+            combined with prs.
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
     """
+    if jobs > 1:
+        if prs is not None:
+            raise ValueError("prs cannot be used with jobs > 1")
+        return _extract_text_inventory_parallel(pptx_path, issues_only, jobs)
+
     if prs is None:
         prs = Presentation(str(pptx_path))
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
+        slide_inventory = extract_slide_inventory(slide, issues_only)
+        if slide_inventory:
+            inventory[f"slide-{slide_idx}"] = slide_inventory
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+    return inventory
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide.
 
-        if not sorted_shapes:
-            continue
+    Args:
+        slide: The python-pptx slide
+        issues_only: If True, only include shapes that have overflow or overlap issues
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+    Returns:
+        Dict of shape_id -> ShapeData, sorted by visual position; empty if
+        the slide has no (matching) text shapes
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
+    return build_slide_inventory(shape_data_list, issues_only)
+
+
+def build_slide_inventory(
+    shape_data_list: List[ShapeData], issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Order one slide's text shapes, assign their IDs and detect overlaps.
+
+    Args:
+        shape_data_list: The slide's text shapes, in document order
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns:
+        Dict of shape_id -> ShapeData, sorted by visual position
+    """
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+# Presentation loaded by each worker process of _extract_text_inventory_parallel
+_worker_presentation: Optional[Any] = None
+
+
+def _init_worker(pptx_path: str, font_cache: Optional[Path]) -> None:
+    """Load the presentation once per worker process."""
+    global _worker_presentation
+    _worker_presentation = Presentation(pptx_path)
+    if font_cache is not None:
+        ShapeData.font_catalog = FontCatalog(cache_path=font_cache)
+
+
+def _extract_worker_slide(slide_idx: int, issues_only: bool) -> Dict[str, ShapeData]:
+    """Extract one slide of the worker's presentation (pickled without shapes)."""
+    return extract_slide_inventory(
+        _worker_presentation.slides[slide_idx],  # type: ignore
+        issues_only,
+    )
+
+
+def _extract_text_inventory_parallel(
+    pptx_path: Path, issues_only: bool, jobs: int
+) -> InventoryData:
+    """extract_text_inventory with slides spread over worker processes."""
+    # Loading the package is cheap next to the per-slide work in the workers
+    slide_count = len(Presentation(str(pptx_path)).slides)
+    if slide_count == 0:
+        return {}
+
+    jobs = min(jobs, slide_count)
+    inventory: InventoryData = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(str(pptx_path), ShapeData.font_catalog.cache_path),
+    ) as executor:
+        chunksize = max(1, slide_count // (jobs * 4))
+        results = executor.map(
+            _extract_worker_slide,
+            range(slide_count),
+            [issues_only] * slide_count,
+            chunksize=chunksize,
+        )
+        # map() yields in slide order, so the inventory keeps that order
+        for slide_idx, slide_inventory in enumerate(results):
+            if slide_inventory:
+                inventory[f"slide-{slide_idx}"] = slide_inventory
 
     return inventory
 
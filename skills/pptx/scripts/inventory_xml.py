@@ -0,0 +1,710 @@
+"""
+Read-only inventory backend that reads slide XML straight from the .pptx.
+
+Produces the same inventory as inventory.extract_text_inventory without
+building python-pptx Presentation, shape or paragraph objects: each
+ppt/slides/slideN.xml is parsed from the zip with lxml, read, and dropped.
+Nothing is written back, so the package is never modified (python-pptx adds
+an empty <a:solidFill/> when ParagraphData reads a run's color).
+
+What python-pptx resolves through its object model is resolved here from the
+package parts:
+- Slide order from the presentation's p:sldIdLst and relationships
+- Absolute positions of shapes in (nested) groups from the group offsets
+- Placeholder position and size inherited from the layout placeholder with
+  the same idx, and from there from the master placeholder of the same type
+
+Classes:
+    XmlParagraphData: ParagraphData read from an <a:p> element
+    XmlShapeData: ShapeData read from a <p:sp> element
+
+Main Functions:
+    extract_text_inventory_xml: Extract all text from a presentation
+
+Usage:
+    python inventory.py input.pptx output.json --backend xml [--issues-only]
+"""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import lxml.etree
+from inventory import (
+    InventoryData,
+    ParagraphData,
+    ShapeData,
+    build_slide_inventory,
+)
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
+from pptx.oxml.simpletypes import (
+    ST_Coordinate,
+    ST_Coordinate32,
+    ST_TextFontSize,
+    ST_TextIndentLevelType,
+    ST_TextSpacingPercentOrPercentString,
+    ST_TextSpacingPoint,
+    XsdBoolean,
+)
+from pptx.util import Centipoints
+
+NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+# Relationship types are matched on their last segment, which is the same in
+# the transitional and strict OOXML namespaces
+REL_OFFICE_DOCUMENT = "officeDocument"
+REL_SLIDE_LAYOUT = "slideLayout"
+REL_SLIDE_MASTER = "slideMaster"
+
+# Elements python-pptx treats as shapes in a p:spTree or p:grpSp
+SHAPE_TAGS = {
+    f"{P}sp",
+    f"{P}grpSp",
+    f"{P}graphicFrame",
+    f"{P}cxnSp",
+    f"{P}pic",
+    f"{P}contentPart",
+}
+
+# Location of each shape element's a:xfrm (graphic frames use p:xfrm)
+XFRM_PATHS = {
+    f"{P}sp": "p:spPr/a:xfrm",
+    f"{P}cxnSp": "p:spPr/a:xfrm",
+    f"{P}pic": "p:spPr/a:xfrm",
+    f"{P}grpSp": "p:grpSpPr/a:xfrm",
+    f"{P}graphicFrame": "p:xfrm",
+}
+
+# Layout placeholder type -> type of the master placeholder it inherits from
+BASE_PLACEHOLDER_TYPES = {
+    PP_PLACEHOLDER.BODY: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.BITMAP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+    PP_PLACEHOLDER.ORG_CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.DATE: PP_PLACEHOLDER.DATE,
+    PP_PLACEHOLDER.FOOTER: PP_PLACEHOLDER.FOOTER,
+    PP_PLACEHOLDER.MEDIA_CLIP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.OBJECT: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.PICTURE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+    PP_PLACEHOLDER.SUBTITLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TABLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TITLE: PP_PLACEHOLDER.TITLE,
+}
+
+# Default text frame insets (EMUs) when a:bodyPr does not set them
+DEFAULT_INSETS = {"lIns": 91440, "tIns": 45720, "rIns": 91440, "bIns": 45720}
+
+# Parsed like python-pptx parses package parts, so text reads the same
+XML_PARSER = lxml.etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+class PackageReader:
+    """Reads parts and relationships of a .pptx package without modifying it."""
+
+    def __init__(self, zip_file: zipfile.ZipFile):
+        """Initialize from an open zip file.
+
+        Args:
+            zip_file: The .pptx package opened for reading
+        """
+        self.zip_file = zip_file
+        # Layouts and masters are shared by many slides, so they are kept
+        self._cached_parts: Dict[str, Any] = {}
+
+    def parse(self, partname: str, cache: bool = False) -> Any:
+        """Parse a part and return its root element.
+
+        Args:
+            partname: Part name within the package, without a leading slash
+            cache: If True, keep the parsed part for later calls
+        """
+        if partname in self._cached_parts:
+            return self._cached_parts[partname]
+
+        with self.zip_file.open(partname) as f:
+            root = lxml.etree.parse(f, XML_PARSER).getroot()
+        if cache:
+            self._cached_parts[partname] = root
+        return root
+
+    def relationships(self, partname: str) -> Dict[str, Tuple[str, str]]:
+        """Get the internal relationships of a part.
+
+        Args:
+            partname: Source part name, or "" for the package relationships
+
+        Returns:
+            Dict of relationship id -> (type, target part name)
+        """
+        directory, filename = posixpath.split(partname)
+        rels_name = posixpath.join(directory, "_rels", f"{filename}.rels")
+        try:
+            root = self.parse(rels_name)
+        except KeyError:  # Part has no relationships
+            return {}
+
+        relationships = {}
+        for rel in root.iterfind("pr:Relationship", NAMESPACES):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+            relationships[rel.get("Id")] = (rel.get("Type", ""), target)
+        return relationships
+
+    def related_part(self, partname: str, reltype: str) -> Optional[str]:
+        """Get the target of a part's first relationship of the given type."""
+        for rel_type, target in self.relationships(partname).values():
+            if rel_type.rsplit("/", 1)[-1] == reltype:
+                return target
+        return None
+
+
+class XmlSlide:
+    """A slide's XML with the layout and master XML it inherits from."""
+
+    def __init__(
+        self,
+        element: Any,
+        layout: Optional[Any],
+        master: Optional[Any],
+        width_emu: Optional[int],
+        height_emu: Optional[int],
+    ):
+        """Initialize from parsed parts.
+
+        Args:
+            element: Root <p:sld> element
+            layout: Root <p:sldLayout> element, if the slide has a layout
+            master: Root <p:sldMaster> element, if the layout has a master
+            width_emu: Slide width from the presentation, if set
+            height_emu: Slide height from the presentation, if set
+        """
+        self.element = element
+        self.layout = layout
+        self.master = master
+        self.width_emu = width_emu
+        self.height_emu = height_emu
+        self.layout_placeholders = _placeholder_elements(layout)
+        self.master_placeholders = _placeholder_elements(master)
+
+    @property
+    def shape_tree(self) -> Any:
+        """The slide's <p:spTree> element, or None if it has none."""
+        return self.element.find("p:cSld/p:spTree", NAMESPACES)
+
+    def shape_value(self, elem: Any, name: str) -> Optional[int]:
+        """Get a shape's x, y, cx or cy, inheriting it for placeholders.
+
+        A slide placeholder that does not set the value inherits it from the
+        layout placeholder with the same idx, which in turn inherits it from
+        the master placeholder of its base type.
+
+        Args:
+            elem: Shape element on the slide
+            name: "x", "y", "cx" or "cy"
+
+        Returns:
+            Value in EMUs, or None if neither the shape nor its bases set it
+        """
+        value = _xfrm_value(elem, name)
+        ph = _placeholder(elem)
+        if value is not None or ph is None:
+            return value
+
+        idx = int(ph.get("idx", "0"))
+        layout_placeholder = next(
+            (e for e in self.layout_placeholders if _placeholder_idx(e) == idx), None
+        )
+        if layout_placeholder is None:
+            return None
+        value = _xfrm_value(layout_placeholder, name)
+        if value is not None:
+            return value
+
+        base_type = BASE_PLACEHOLDER_TYPES.get(_placeholder_type(layout_placeholder))
+        master_placeholder = next(
+            (e for e in self.master_placeholders if _placeholder_type(e) == base_type),
+            None,
+        )
+        if master_placeholder is None:
+            return None
+        return _xfrm_value(master_placeholder, name)
+
+    def default_font_size(self, ph_type: PP_PLACEHOLDER) -> Optional[float]:
+        """Get the default font size of a placeholder type from the layout.
+
+        Same lookup as ShapeData.get_default_font_size: the first defRPr with
+        a size in the first layout placeholder of the same type.
+
+        Returns:
+            Default font size in points, or None if not found
+        """
+        for layout_placeholder in self.layout_placeholders:
+            if _placeholder_type(layout_placeholder) == ph_type:
+                for elem in layout_placeholder.iter():
+                    if not isinstance(elem.tag, str):  # Comments and PIs
+                        return None
+                    if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                        try:
+                            return float(sz) / 100.0  # Convert EMUs to points
+                        except ValueError:
+                            return None
+                break
+        return None
+
+
+class XmlParagraph:
+    """Read-only view of an <a:p> element with the text python-pptx reports."""
+
+    def __init__(self, element: Any):
+        """Initialize from an <a:p> element.
+
+        Args:
+            element: The paragraph element
+        """
+        self.element = element
+        # Runs and fields contribute their text, line breaks a vertical tab
+        parts = []
+        for child in element:
+            if child.tag == f"{A}r" or child.tag == f"{A}fld":
+                t = child.find(f"{A}t")
+                parts.append((t.text or "") if t is not None else "")
+            elif child.tag == f"{A}br":
+                parts.append("\v")
+        self.text = "".join(parts)
+
+
+class XmlTextFrame:
+    """Read-only view of a <p:txBody> with the attributes ShapeData reads."""
+
+    def __init__(self, element: Any):
+        """Initialize from a <p:txBody> element.
+
+        Args:
+            element: The text body element
+        """
+        self.paragraphs = [XmlParagraph(p) for p in element.iterfind(f"{A}p")]
+        self.text = "\n".join(paragraph.text for paragraph in self.paragraphs)
+
+        body_pr = element.find(f"{A}bodyPr")
+        insets = {
+            name: (
+                ST_Coordinate32.from_xml(value)
+                if body_pr is not None and (value := body_pr.get(name)) is not None
+                else default
+            )
+            for name, default in DEFAULT_INSETS.items()
+        }
+        self.margin_left = insets["lIns"]
+        self.margin_top = insets["tIns"]
+        self.margin_right = insets["rIns"]
+        self.margin_bottom = insets["bIns"]
+
+
+class XmlShape:
+    """Read-only stand-in for a python-pptx shape, exposing its text frame."""
+
+    def __init__(self, text_frame: XmlTextFrame):
+        self.text_frame = text_frame
+
+
+class XmlParagraphData(ParagraphData):
+    """ParagraphData read from the XML of an <a:p> element."""
+
+    def __init__(self, paragraph: XmlParagraph):
+        """Initialize from a paragraph view.
+
+        Args:
+            paragraph: The XmlParagraph to read
+        """
+        self.text: str = paragraph.text.strip()
+        self.bullet: bool = False
+        self.level: Optional[int] = None
+        self.alignment: Optional[str] = None
+        self.space_before: Optional[float] = None
+        self.space_after: Optional[float] = None
+        self.font_name: Optional[str] = None
+        self.font_size: Optional[float] = None
+        self.bold: Optional[bool] = None
+        self.italic: Optional[bool] = None
+        self.underline: Optional[bool] = None
+        self.color: Optional[str] = None
+        self.theme_color: Optional[str] = None
+        self.line_spacing: Optional[float] = None
+
+        p = paragraph.element
+        pPr = p.find(f"{A}pPr")
+        if pPr is not None:
+            self._read_paragraph_properties(pPr)
+
+        # Extract font properties from first run
+        run = p.find(f"{A}r")
+        rPr = run.find(f"{A}rPr") if run is not None else None
+        if rPr is not None:
+            self._read_run_properties(rPr)
+
+        # Add line spacing if set
+        ln_spc = pPr.find(f"{A}lnSpc") if pPr is not None else None
+        if ln_spc is not None:
+            spc_pts = ln_spc.find(f"{A}spcPts")
+            spc_pct = ln_spc.find(f"{A}spcPct")
+            if spc_pts is not None:
+                line_spacing = ST_TextSpacingPoint.from_xml(spc_pts.get("val"))
+                self.line_spacing = round(line_spacing.pt, 2)
+            elif spc_pct is not None:
+                # Multiplier - convert to points
+                multiplier = ST_TextSpacingPercentOrPercentString.from_xml(
+                    spc_pct.get("val")
+                )
+                font_size = self.font_size if self.font_size else 12.0
+                self.line_spacing = round(multiplier * font_size, 2)
+
+    def _read_paragraph_properties(self, pPr: Any) -> None:
+        """Read bullet, alignment and spacing from <a:pPr>."""
+        if pPr.find(f"{A}buChar") is not None or pPr.find(f"{A}buAutoNum") is not None:
+            self.bullet = True
+            lvl = pPr.get("lvl")
+            self.level = ST_TextIndentLevelType.from_xml(lvl) if lvl is not None else 0
+
+        # Add alignment if not LEFT (default)
+        algn = pPr.get("algn")
+        if algn is not None:
+            alignment = PP_ALIGN.from_xml(algn)
+            if alignment in (PP_ALIGN.CENTER, PP_ALIGN.RIGHT, PP_ALIGN.JUSTIFY):
+                self.alignment = alignment.name
+
+        # Add spacing properties if set
+        for tag, attr in (("spcBef", "space_before"), ("spcAft", "space_after")):
+            spc_pts = pPr.find(f"{A}{tag}/{A}spcPts")
+            if spc_pts is not None:
+                spacing = ST_TextSpacingPoint.from_xml(spc_pts.get("val"))
+                if spacing:
+                    setattr(self, attr, spacing.pt)
+
+    def _read_run_properties(self, rPr: Any) -> None:
+        """Read font name, size, style and color from a run's <a:rPr>."""
+        latin = rPr.find(f"{A}latin")
+        if latin is not None and latin.get("typeface"):
+            self.font_name = latin.get("typeface")
+        if (sz := rPr.get("sz")) is not None:
+            size = Centipoints(ST_TextFontSize.from_xml(sz))
+            if size:
+                self.font_size = size.pt
+        if (b := rPr.get("b")) is not None:
+            self.bold = XsdBoolean.from_xml(b)
+        if (i := rPr.get("i")) is not None:
+            self.italic = XsdBoolean.from_xml(i)
+        if (u := rPr.get("u")) is not None:
+            underline = MSO_UNDERLINE.from_xml(u)
+            if underline is MSO_UNDERLINE.NONE:
+                self.underline = False
+            elif underline is MSO_UNDERLINE.SINGLE_LINE:
+                self.underline = True
+            else:
+                self.underline = underline
+
+        # Color applies only to a solid fill, given as RGB or as a theme color
+        fill = next((child for child in rPr if _is_fill(child)), None)
+        if fill is None or fill.tag != f"{A}solidFill":
+            return
+        color = next((child for child in fill if _is_color(child)), None)
+        if color is None:
+            return
+        if color.tag == f"{A}srgbClr":
+            self.color = str(RGBColor.from_string(color.get("val", "")))
+        elif color.tag == f"{A}schemeClr":
+            self.theme_color = MSO_THEME_COLOR.from_xml(color.get("val")).name
+
+
+class XmlShapeData(ShapeData):
+    """ShapeData read from the XML of a <p:sp> element.
+
+    Has no python-pptx shape: shape is set to None once the checks have run,
+    as for shapes returned by worker processes.
+    """
+
+    paragraph_class = XmlParagraphData
+
+    def __init__(
+        self,
+        element: Any,
+        text_frame: XmlTextFrame,
+        absolute_left: int,
+        absolute_top: int,
+        slide: XmlSlide,
+    ):
+        """Initialize from a shape element.
+
+        Args:
+            element: The <p:sp> element (should be pre-validated)
+            text_frame: View of the shape's text body
+            absolute_left: Absolute left position in EMUs
+            absolute_top: Absolute top position in EMUs
+            slide: The slide the shape is on
+        """
+        self.shape = XmlShape(text_frame)
+        self.shape_id: str = ""  # Will be set after sorting
+        self.slide_width_emu = slide.width_emu
+        self.slide_height_emu = slide.height_emu
+        self._master_element = slide.master
+
+        # Get placeholder type and default font size if applicable
+        self.placeholder_type: Optional[str] = None
+        self.default_font_size: Optional[float] = None
+        ph = _placeholder(element)
+        if ph is not None:
+            ph_type = _placeholder_type(element)
+            self.placeholder_type = ph_type.name
+            self.default_font_size = slide.default_font_size(ph_type)
+
+        width_emu = slide.shape_value(element, "cx") or 0
+        height_emu = slide.shape_value(element, "cy") or 0
+        self.left: float = round(self.emu_to_inches(absolute_left), 2)
+        self.top: float = round(self.emu_to_inches(absolute_top), 2)
+        self.width: float = round(self.emu_to_inches(width_emu), 2)
+        self.height: float = round(self.emu_to_inches(height_emu), 2)
+
+        # Store EMU positions for overflow calculations
+        self.left_emu = absolute_left
+        self.top_emu = absolute_top
+        self.width_emu = width_emu
+        self.height_emu = height_emu
+
+        # Calculate overflow status
+        self.frame_overflow_bottom: Optional[float] = None
+        self.slide_overflow_right: Optional[float] = None
+        self.slide_overflow_bottom: Optional[float] = None
+        self.overlapping_shapes: Dict[str, float] = {}
+        self.warnings: List[str] = []
+        self._paragraphs: Optional[List[ParagraphData]] = None
+        self._estimate_frame_overflow()
+        self._calculate_slide_overflow()
+        self._detect_bullet_issues()
+
+        # Keep only what to_dict needs, so the slide's XML can be freed
+        self._paragraphs = self.paragraphs
+        self.shape = None
+        self._master_element = None
+
+    def _get_default_font_size(self) -> int:
+        """Get default font size from the master's text styles."""
+        if self._master_element is None:
+            return 14
+        return self._text_style_font_size(self._master_element)
+
+
+def is_valid_xml_shape(element: Any, text_frame: XmlTextFrame) -> bool:
+    """Check if a shape contains meaningful text content (see is_valid_shape)."""
+    text = text_frame.text.strip()
+    if not text:
+        return False
+
+    # Skip slide numbers and numeric footers
+    if _placeholder(element) is not None:
+        placeholder_type = _placeholder_type(element)
+        if placeholder_type == PP_PLACEHOLDER.SLIDE_NUMBER:
+            return False
+        if placeholder_type == PP_PLACEHOLDER.FOOTER and text.isdigit():
+            return False
+
+    return True
+
+
+def collect_xml_shapes(
+    parent: Any, slide: XmlSlide, parent_left: int = 0, parent_top: int = 0
+) -> List[XmlShapeData]:
+    """Recursively collect the shapes with valid text under a shape tree or group.
+
+    Args:
+        parent: <p:spTree> or <p:grpSp> element
+        slide: The slide the shapes are on
+        parent_left: Accumulated left offset from parent groups (in EMUs)
+        parent_top: Accumulated top offset from parent groups (in EMUs)
+
+    Returns:
+        List of XmlShapeData with absolute positions, in document order
+    """
+    result = []
+    for elem in parent:
+        if elem.tag not in SHAPE_TAGS:
+            continue
+
+        if elem.tag == f"{P}grpSp":
+            # Children are positioned relative to the group's offset
+            result.extend(
+                collect_xml_shapes(
+                    elem,
+                    slide,
+                    parent_left + (slide.shape_value(elem, "x") or 0),
+                    parent_top + (slide.shape_value(elem, "y") or 0),
+                )
+            )
+            continue
+
+        # Only autoshapes, text boxes and placeholders have a text frame
+        tx_body = elem.find("p:txBody", NAMESPACES) if elem.tag == f"{P}sp" else None
+        if tx_body is None:
+            continue
+        text_frame = XmlTextFrame(tx_body)
+        if is_valid_xml_shape(elem, text_frame):
+            result.append(
+                XmlShapeData(
+                    elem,
+                    text_frame,
+                    parent_left + (slide.shape_value(elem, "x") or 0),
+                    parent_top + (slide.shape_value(elem, "y") or 0),
+                    slide,
+                )
+            )
+    return result
+
+
+def extract_text_inventory_xml(
+    pptx_path: Path, issues_only: bool = False
+) -> InventoryData:
+    """Extract text content from all slides, reading the slide XML directly.
+
+    Same result as inventory.extract_text_inventory, except that the
+    returned ShapeData objects have no shape attached.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
+    """
+    inventory: InventoryData = {}
+
+    with zipfile.ZipFile(pptx_path) as zip_file:
+        package = PackageReader(zip_file)
+        presentation_part = package.related_part("", REL_OFFICE_DOCUMENT)
+        if presentation_part is None:
+            raise ValueError(f"No presentation part found in {pptx_path}")
+        presentation = package.parse(presentation_part)
+        presentation_rels = package.relationships(presentation_part)
+
+        slide_size = presentation.find("p:sldSz", NAMESPACES)
+        width_emu = height_emu = None
+        if slide_size is not None:
+            width_emu = ST_Coordinate.from_xml(slide_size.get("cx"))
+            height_emu = ST_Coordinate.from_xml(slide_size.get("cy"))
+
+        slide_ids = presentation.iterfind("p:sldIdLst/p:sldId", NAMESPACES)
+        for slide_idx, slide_id in enumerate(slide_ids):
+            slide_part = presentation_rels[slide_id.get(R_ID)][1]
+            layout_part = package.related_part(slide_part, REL_SLIDE_LAYOUT)
+            master_part = (
+                package.related_part(layout_part, REL_SLIDE_MASTER)
+                if layout_part
+                else None
+            )
+            slide = XmlSlide(
+                package.parse(slide_part),
+                package.parse(layout_part, cache=True) if layout_part else None,
+                package.parse(master_part, cache=True) if master_part else None,
+                width_emu,
+                height_emu,
+            )
+
+            shape_tree = slide.shape_tree
+            shape_data_list = (
+                collect_xml_shapes(shape_tree, slide) if shape_tree is not None else []
+            )
+            if not shape_data_list:
+                continue
+
+            slide_inventory = build_slide_inventory(shape_data_list, issues_only)
+            if slide_inventory:
+                inventory[f"slide-{slide_idx}"] = slide_inventory
+
+    return inventory
+
+
+def _placeholder(elem: Any) -> Optional[Any]:
+    """Get a shape element's <p:ph>, or None if it is not a placeholder."""
+    if len(elem) == 0:
+        return None
+    return elem[0].find("p:nvPr/p:ph", NAMESPACES)
+
+
+def _placeholder_type(elem: Any) -> Optional[PP_PLACEHOLDER]:
+    """Get a placeholder's type (OBJECT when not set), or None if not a placeholder."""
+    ph = _placeholder(elem)
+    if ph is None:
+        return None
+    return PP_PLACEHOLDER.from_xml(ph.get("type", "obj"))
+
+
+def _placeholder_idx(elem: Any) -> Optional[int]:
+    """Get a placeholder's idx (0 when not set), or None if not a placeholder."""
+    ph = _placeholder(elem)
+    if ph is None:
+        return None
+    return int(ph.get("idx", "0"))
+
+
+def _placeholder_elements(root: Optional[Any]) -> List[Any]:
+    """Get the placeholders in a layout's or master's shape tree, in order."""
+    if root is None:
+        return []
+    shape_tree = root.find("p:cSld/p:spTree", NAMESPACES)
+    if shape_tree is None:
+        return []
+    return [
+        elem
+        for elem in shape_tree
+        if elem.tag in SHAPE_TAGS and _placeholder(elem) is not None
+    ]
+
+
+def _xfrm_value(elem: Any, name: str) -> Optional[int]:
+    """Get x or y (from a:off) or cx or cy (from a:ext) set on a shape itself."""
+    path = XFRM_PATHS.get(elem.tag)
+    xfrm = elem.find(path, NAMESPACES) if path else None
+    if xfrm is None:
+        return None
+    child = xfrm.find(f"{A}off" if name in ("x", "y") else f"{A}ext")
+    if child is None or child.get(name) is None:
+        return None
+    return ST_Coordinate.from_xml(child.get(name))
+
+
+def _is_fill(elem: Any) -> bool:
+    """Whether an element is one of the fill choices of a:rPr."""
+    return elem.tag in (
+        f"{A}noFill",
+        f"{A}solidFill",
+        f"{A}gradFill",
+        f"{A}blipFill",
+        f"{A}pattFill",
+        f"{A}grpFill",
+    )
+
+
+def _is_color(elem: Any) -> bool:
+    """Whether an element is one of the color choices of a:solidFill."""
+    return elem.tag in (
+        f"{A}scrgbClr",
+        f"{A}srgbClr",
+        f"{A}hslClr",
+        f"{A}sysClr",
+        f"{A}schemeClr",
+        f"{A}prstClr",
+    )